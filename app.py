@@ -1,20 +1,31 @@
 import streamlit as st
 import pandas as pd
 
-from topsis_utils import calculate_topsis
+from data_loader import UPLOAD_EXTENSIONS
+from dataset_preview import DatasetPreview
+from dataset_profile import DatasetProfile
 from data_mapping import (
-    load_model_features,
     get_feature_metadata,
-    get_strategy_feature_mapping,
-    map_dataset_to_features,
-    build_topsis_matrix
+    get_strategy_catalog,
+    get_synonym_store,
+    mapping_methods,
+    confirm_column_mapping,
+    model_signature
 )
+from instrumentation import span, start_trace, trace_records, prometheus_text
+from pipeline import build_analysis_pipeline, uses_column_projection
+from streamlit_adapter import load_model_features
+from scoring import segment_satisfaction
 from ui_components import (
     set_page_style,
     show_progress_indicator,
     create_metric_card,
     show_user_guide,
     show_summary_stats,
+    show_dataset_preview,
+    show_download_button,
+    show_performance_panel,
+    show_weight_editor,
     show_about
 )
 
@@ -24,6 +35,32 @@ LIGHT = "#ffffff"
 MUTED = "#6b7280"
 SOFT = "#fff6d6"
 
+# Upload di atas ukuran ini dibaca dengan proyeksi kolom
+LARGE_FILE_BYTES = 50 * 1024 * 1024
+
+def get_dataset_preview(df):
+    """DatasetPreview per dataset di sesi ini (index sort/filter dipakai ulang antar rerun)"""
+    preview = st.session_state.get('preview')
+    if preview is None or preview.df is not df:
+        preview = st.session_state.preview = DatasetPreview(df)
+    return preview
+
+def get_segment_candidates(df, profile=None, max_categories=50, max_integer_values=10):
+    """
+    Kolom yang layak untuk segmentasi: kategori/string dengan <= max_categories nilai, atau
+    integer dengan <= max_integer_values nilai (mis. flag member). Distinct dari profil dataset.
+    """
+    distinct = profile.distinct_counts() if profile is not None else df.nunique()
+    candidates = []
+    for c in df.columns:
+        n = distinct.get(c, max_categories + 1)
+        if df[c].dtype == object or isinstance(df[c].dtype, pd.CategoricalDtype):
+            if n <= max_categories:
+                candidates.append(c)
+        elif pd.api.types.is_integer_dtype(df[c]) and 1 < n <= max_integer_values:
+            candidates.append(c)
+    return candidates
+
 def main():
     st.set_page_config(
         page_title="SISTEM REKOMENDASI STRATEGI PENINGKATAN KEPUASAN PELANGGAN RESTORAN",
@@ -35,6 +72,9 @@ def main():
     # Apply custom styling
     set_page_style()
     
+    # Semua stage yang diinstrumentasi pada rerun ini dicatat ke trace ini
+    perf_spans = start_trace()
+    
     # ==============================================================================
     # SIDEBAR - NAVIGATION & INFO
     # ==============================================================================
@@ -74,6 +114,13 @@ def main():
         
         st.markdown("---")
         
+        # Performance panel (diisi di akhir run atau sebelum stop(), setelah semua stage tercatat)
+        show_perf = st.checkbox("Performance panel", value=False,
+                                help="Durasi, jumlah baris, dan delta memori per stage pada run terakhir")
+        perf_placeholder = st.empty()
+        
+        st.markdown("---")
+        
         # Footer
         st.markdown("""
         <div style='color: rgba(255,255,255,0.6); font-size: 12px; text-align: center;'>
@@ -82,6 +129,17 @@ def main():
         </div>
         """, unsafe_allow_html=True)
     
+    def render_performance_panel():
+        if show_perf:
+            with perf_placeholder.container():
+                show_performance_panel(trace_records(perf_spans), prometheus_text())
+    
+    def stop():
+        # st.stop() tidak bisa dicegat try/finally (elemen setelahnya ikut dihentikan),
+        # jadi panel diisi dulu agar run yang berhenti awal tetap punya data timing
+        render_performance_panel()
+        st.stop()
+    
     # ==============================================================================
     # MAIN CONTENT AREA
     # ==============================================================================
@@ -121,7 +179,7 @@ def main():
                         box-shadow: 0 4px 12px rgba(0,0,0,0.1); margin-bottom: 30px;'>
                 <h2 style='color: #000000; border-left:5px solid #ffc20f; padding-left:12px;'>Step 1: Upload Dataset Pelanggan</h2>
                 <p style='color: #6b7280;'>
-                    Upload file CSV yang berisi data pelanggan restoran Anda. Sistem akan otomatis 
+                    Upload file CSV, Parquet, atau Arrow/Feather yang berisi data pelanggan restoran Anda. Sistem akan otomatis 
                     mencocokkan kolom dengan features yang dibutuhkan.
                 </p>
             </div>
@@ -131,17 +189,23 @@ def main():
             
             with col1:
                 uploaded_file = st.file_uploader(
-                    "Pilih file CSV Anda",
-                    type=['csv'],
-                    help="Upload file CSV dengan data pelanggan"
+                    "Pilih file dataset Anda",
+                    type=UPLOAD_EXTENSIONS,
+                    help="Upload file CSV, Parquet, atau Arrow/Feather dengan data pelanggan. "
+                         "Parquet/Arrow lebih cepat untuk data besar karena hanya kolom yang dipakai yang dibaca."
                 )
+                data_source = st.text_input(
+                    "Sumber data (opsional)",
+                    placeholder="mis. nama vendor POS",
+                    help="Sinonim kolom yang Anda konfirmasi disimpan khusus untuk sumber ini"
+                ).strip() or None
             
             with col2:
                 st.markdown("""
                 <div style='background: #fff6d6; border-left: 4px solid #ffc20f; color: #000000; padding: 20px; border-radius: 10px; '>
                     <strong style='color: #000000;'>💡 Tips:</strong><br>
                     <ul style='color: #4b5563; font-size: 14px; margin-top: 10px;'>
-                        <li>Format: CSV</li>
+                        <li>Format: CSV, Parquet, Arrow/Feather</li>
                         <li>Minimal 5 kolom match</li>
                         <li>Data bersih tanpa missing values banyak</li>
                     </ul>
@@ -178,24 +242,46 @@ def main():
                     "text/csv"
                 )
             
-            st.stop()
+            stop()
         
-        # Load dataset
+        model, feature_names = load_model_features("model_satisfied_v2.pkl", "feature_names.pkl")
+        
+        # Pipeline per sesi: step hanya dihitung ulang jika inputnya berubah
+        if 'pipeline' not in st.session_state:
+            st.session_state.pipeline = build_analysis_pipeline(large_file_bytes=LARGE_FILE_BYTES)
+        pipeline = st.session_state.pipeline
+        pipeline.set_input("upload", uploaded_file,
+                           key=getattr(uploaded_file, "file_id", None) or f"{uploaded_file.name}:{uploaded_file.size}")
+        pipeline.set_input("model", model, key=model_signature("model_satisfied_v2.pkl", "feature_names.pkl"))
+        pipeline.set_input("feature_names", feature_names)
+        pipeline.set_input("source", data_source)
+        pipeline.set_input("projection_source",
+                           data_source if uses_column_projection(uploaded_file, LARGE_FILE_BYTES) else None)
+        pipeline.set_input("synonym_revision", get_synonym_store().revision(data_source))
+        
+        # Load dataset (file besar: hanya kolom yang dipakai mapping yang di-parse)
         try:
-            df = pd.read_csv(uploaded_file, sep=None, engine="python")
+            dataset = pipeline.run("dataset")
+            df, aggregates, usecols = dataset['df'], dataset['aggregates'], dataset['usecols']
             st.session_state.df = df
+            st.session_state.aggregates = aggregates
 
             st.success("Dataset berhasil dimuat!")
+            if aggregates.memory_saved_bytes > 0:
+                st.caption(
+                    f"Memori dataset: {aggregates.memory_before_bytes / 1e6:.1f} MB → "
+                    f"{aggregates.memory_after_bytes / 1e6:.1f} MB "
+                    f"(hemat {aggregates.memory_saved_bytes / 1e6:.1f} MB)"
+                )
+            if usecols is not None:
+                st.info(f"File besar terdeteksi: hanya {len(usecols)} kolom yang relevan untuk mapping yang dibaca.")
 
         except Exception as e:
-            st.error(f"Error membaca file CSV: {e}")
-            st.stop()
+            st.error(f"Error membaca file dataset: {e}")
+            stop()
 
         with st.expander("Preview Dataset", expanded=True):
-            st.dataframe(
-                df.head(10),
-                use_container_width=True
-            )
+            show_dataset_preview(get_dataset_preview(df), key="home_preview", page_size=10)
 
             st.markdown(
                 f"""
@@ -221,17 +307,16 @@ def main():
             </div>
             """, unsafe_allow_html=True)
         
-        model, feature_names = load_model_features("model_satisfied_v2.pkl", "feature_names.pkl")
-        
         if model is None or feature_names is None:
             st.error("Model tidak dapat dimuat. Pastikan file model tersedia.")
-            st.stop()
+            stop()
         
         with st.spinner("Sedang melakukan mapping features..."):
             MIN_FEATURES = 5
-            is_valid, message, matched_features, num_matched, mapping_detail, df_final = map_dataset_to_features(
-                df, feature_names, MIN_FEATURES
-            )
+            mapping = pipeline.run("mapping")
+            is_valid, message = mapping['is_valid'], mapping['message']
+            matched_features, num_matched = mapping['matched_features'], mapping['num_matched']
+            mapping_detail, df_final = mapping['mapping_detail'], mapping['df_final']
         
         st.session_state.num_matched = num_matched
         st.session_state.mapping_done = True
@@ -268,10 +353,28 @@ def main():
             - Tambahkan kolom yang relevan dengan bisnis restoran
             - Lihat contoh format dataset di bagian User Guide
             """.format(num_matched, MIN_FEATURES))
-            st.stop()
+            stop()
         
         st.success(message)
         
+        # Konfirmasi hasil fuzzy match -> disimpan sebagai sinonim
+        methods = mapping_methods(df.columns, feature_names, data_source)
+        fuzzy_matches = {feat: mapping_detail[feat] for feat, method in methods.items() if method == 'fuzzy'}
+        if fuzzy_matches:
+            with st.expander(f"Konfirmasi Fuzzy Match ({len(fuzzy_matches)})", expanded=False):
+                st.caption(
+                    "Kolom berikut dicocokkan lewat kemiripan nama. Centang yang benar lalu simpan "
+                    "agar upload berikutnya langsung dikenali sebagai sinonim."
+                )
+                confirmed = {
+                    feat: col for feat, col in fuzzy_matches.items()
+                    if st.checkbox(f"{col} → {feat}", value=True, key=f"confirm_{feat}")
+                }
+                if st.button("Simpan sebagai Sinonim", disabled=not confirmed):
+                    n_learned = confirm_column_mapping(confirmed, data_source)
+                    st.success(f"{n_learned} sinonim baru disimpan"
+                               + (f" untuk sumber '{data_source}'." if data_source else "."))
+        
         with st.expander("Detail Mapping per Kategori", expanded=True):
             feature_metadata = get_feature_metadata()
             
@@ -323,10 +426,19 @@ def main():
             </div>
             """, unsafe_allow_html=True)
         
+        importance_source = st.radio(
+            "Sumber feature importance",
+            ["Dataset (SHAP)", "Global (training)"],
+            horizontal=True,
+            help="Dataset (SHAP): rata-rata |kontribusi SHAP| pada data Anda. "
+                 "Global: importance statis dari proses training model."
+        )
+        
+        pipeline.set_input("importance_source", "shap" if importance_source == "Dataset (SHAP)" else "global")
+        
         try:
-            feature_importances = pd.Series(model.feature_importances_, index=feature_names)
-            matched_importances = feature_importances[[mf for mf in mapping_detail.keys() if mf in feature_names]]
-            matched_importances = matched_importances / matched_importances.sum()
+            with st.spinner("Menghitung feature importance pada dataset..."):
+                matched_importances = pipeline.run("importance")
             
             st.session_state.analysis_done = True
             
@@ -361,7 +473,8 @@ def main():
                     paper_bgcolor='rgba(0,0,0,0)'
                 )
                 
-                st.plotly_chart(fig, use_container_width=True)
+                with span("render:importance_chart"):
+                    st.plotly_chart(fig, use_container_width=True)
             
             with col2:
                 st.markdown("""
@@ -392,7 +505,49 @@ def main():
             
         except Exception as e:
             st.error(f"Error menganalisis feature importance: {str(e)}")
-            st.stop()
+            stop()
+        
+        with st.expander("Prediksi Kepuasan per Pelanggan", expanded=False):
+            st.markdown("""
+            <p style='color: #6b7280;'>
+                Model XGBoost memprediksi probabilitas HighSatisfaction untuk setiap pelanggan
+                pada dataset, lalu diringkas per segmen.
+            </p>
+            """, unsafe_allow_html=True)
+            
+            if st.checkbox("Hitung prediksi kepuasan"):
+                try:
+                    with st.spinner("Memprediksi kepuasan pelanggan..."):
+                        satisfaction_proba = pipeline.run("scoring")
+                    
+                    col1, col2 = st.columns(2)
+                    with col1:
+                        create_metric_card("Rata-rata Probabilitas Puas", f"{satisfaction_proba.mean():.1%}")
+                    with col2:
+                        create_metric_card("Diprediksi Puas", f"{(satisfaction_proba >= 0.5).mean():.1%}")
+                    
+                    segment_candidates = get_segment_candidates(df, st.session_state.get('aggregates'))
+                    if segment_candidates:
+                        segment_cols = st.multiselect(
+                            "Segmentasi berdasarkan",
+                            segment_candidates,
+                            default=segment_candidates[:1]
+                        )
+                        if segment_cols:
+                            st.dataframe(
+                                segment_satisfaction(df, satisfaction_proba, segment_cols).style.format({
+                                    'Mean_Probability': '{:.1%}', 'Satisfaction_Rate': '{:.1%}'
+                                }),
+                                use_container_width=True
+                            )
+                    
+                    show_download_button(
+                        satisfaction_proba.to_frame(),
+                        "customer_satisfaction_predictions",
+                        label="Download Prediksi per Pelanggan"
+                    )
+                except Exception as e:
+                    st.error(f"Error memprediksi kepuasan: {str(e)}")
         
         st.markdown("<br>", unsafe_allow_html=True)
         
@@ -410,18 +565,14 @@ def main():
             </div>
             """, unsafe_allow_html=True)
         
-        strategy_mapping = get_strategy_feature_mapping()
+        strategy_catalog = get_strategy_catalog()
         
         with st.spinner("Menghitung ranking strategi..."):
-            decision_matrix, weights, criteria_types = build_topsis_matrix(
-                list(matched_importances.index),
-                feature_importance_dict,
-                strategy_mapping
-            )
+            decision_matrix, weights, criteria_types = pipeline.run("topsis_matrix")
         
         if decision_matrix is None:
             st.error("Tidak ada strategi yang cocok dengan features yang terdeteksi.")
-            st.stop()
+            stop()
         
         col1, col2, col3 = st.columns(3)
         
@@ -444,7 +595,7 @@ def main():
             )
         
         try:
-            topsis_results = calculate_topsis(decision_matrix, weights, criteria_types)
+            topsis_results = pipeline.run("topsis")
             st.session_state.results_done = True
             
             st.markdown("<br>", unsafe_allow_html=True)
@@ -483,7 +634,8 @@ def main():
                 paper_bgcolor='rgba(0,0,0,0)'
             )
             
-            st.plotly_chart(fig, use_container_width=True)
+            with span("render:ranking_chart"):
+                st.plotly_chart(fig, use_container_width=True)
             
             st.markdown("<br>", unsafe_allow_html=True)
             st.markdown("""
@@ -521,12 +673,12 @@ def main():
                         st.markdown(f"""
                             <div style='background: #f3f3f3; padding: 10px; border-radius: 5px; 
                                         margin-bottom: 8px; border-left: 3px solid #000000;'> 
-                                        {strategy_mapping[strategy]['description']}
+                                        {strategy_catalog.description(strategy)}
                             </div>
                             """, unsafe_allow_html=True)                        
                         
                         st.markdown("#### Langkah Implementasi")
-                        implementation_steps = strategy_mapping[strategy]['implementation']
+                        implementation_steps = strategy_catalog.implementation(strategy)
                         
                         for step_idx, step in enumerate(implementation_steps, 1):
                             st.markdown(f"""
@@ -538,7 +690,7 @@ def main():
                             """, unsafe_allow_html=True)
                         
                         st.markdown("#### Features yang Relevan")
-                        strategy_features = strategy_mapping[strategy]['features']
+                        strategy_features = strategy_catalog.features(strategy)
                         matched_strategy_features = {f: w for f, w in strategy_features.items() 
                                                     if f in matched_importances.index}
                         
@@ -559,9 +711,108 @@ def main():
                                 use_container_width=True
                             )
         
+            st.markdown("<br>", unsafe_allow_html=True)
+            with st.expander("Analisis Sensitivitas Bobot", expanded=False):
+                st.markdown("""
+                <p style='color: #6b7280;'>
+                    Seberapa stabil Top 3 strategi jika bobot feature importance sedikit berubah?
+                    Sistem mengambil sampel bobot acak di sekitar bobot asli (Monte Carlo).
+                </p>
+                """, unsafe_allow_html=True)
+                
+                col1, col2 = st.columns(2)
+                with col1:
+                    n_samples = st.select_slider(
+                        "Jumlah sampel",
+                        options=[1000, 10000, 50000, 100000],
+                        value=10000
+                    )
+                with col2:
+                    noise_pct = st.slider("Variasi bobot (±%)", 5, 50, 10)
+                
+                if st.checkbox("Jalankan analisis sensitivitas"):
+                    pipeline.set_input("sensitivity_params", {
+                        'n_samples': n_samples,
+                        'top_k': 3,
+                        'method': 'uniform',
+                        'noise': noise_pct / 100,
+                        'seed': 42
+                    })
+                    sensitivity = pipeline.run("sensitivity")
+                    
+                    st.markdown("#### Probabilitas Masuk Top 3")
+                    st.dataframe(
+                        sensitivity['summary'].head(10).style.format({
+                            'Mean_Rank': '{:.2f}', 'Std_Rank': '{:.2f}',
+                            'P_Top1': '{:.1%}', 'P_Top3': '{:.1%}'
+                        }).background_gradient(subset=['P_Top3'], cmap='Greens'),
+                        use_container_width=True
+                    )
+                    
+                    st.markdown("#### Threshold Pembalikan Ranking per Kriteria")
+                    st.caption("Perubahan relatif bobot (turun/naik) yang membuat strategi peringkat 1 berganti. Kosong = tidak berbalik.")
+                    st.dataframe(
+                        sensitivity['reversal'].sort_values('Weight', ascending=False).style.format({
+                            'Weight': '{:.4f}',
+                            'Decrease_To_Reverse': '{:.0%}',
+                            'Increase_To_Reverse': '{:.0%}'
+                        }, na_rep='-'),
+                        use_container_width=True
+                    )
+        
+            st.markdown("<br>", unsafe_allow_html=True)
+            with st.expander("Editor Bobot Interaktif", expanded=False):
+                st.markdown("""
+                <p style='color: #6b7280;'>
+                    Ubah bobot kriteria secara manual dan lihat ranking strategi langsung berubah.
+                    Bobot dinormalisasi ulang otomatis (jumlah = 1).
+                </p>
+                """, unsafe_allow_html=True)
+                show_weight_editor(
+                    pipeline.run("prepared_topsis"),
+                    pd.Series(weights, index=decision_matrix.columns, dtype=float)
+                )
+            
+            st.markdown("<br>", unsafe_allow_html=True)
+            with st.expander("TOPSIS per Segmen", expanded=False):
+                st.markdown("""
+                <p style='color: #6b7280;'>
+                    Ranking strategi berbeda per kelompok pelanggan (mis. waktu kunjungan, member loyalty,
+                    jenis masakan). Importance SHAP dihitung per segmen, lalu semua segmen di-ranking sekaligus.
+                </p>
+                """, unsafe_allow_html=True)
+                
+                segment_by = st.multiselect(
+                    "Segmen berdasarkan",
+                    get_segment_candidates(df, st.session_state.get('aggregates')),
+                    key="segment_topsis_by"
+                )
+                if segment_by:
+                    pipeline.set_input("segment_by", tuple(segment_by))
+                    with st.spinner("Menghitung importance dan ranking per segmen..."):
+                        segment_results = pipeline.run("segment_topsis")
+                    
+                    segment_rankings = segment_results['rankings']
+                    if segment_rankings is None:
+                        st.info("Tidak ada segmen dengan jumlah pelanggan yang cukup untuk dianalisis.")
+                    else:
+                        top_segment = segment_rankings.groupby('Segment', sort=False).head(3).copy()
+                        top_segment['Posisi'] = top_segment.groupby('Segment', sort=False).cumcount() + 1
+                        summary = top_segment.pivot(index='Segment', columns='Posisi', values='Strategy')
+                        summary = summary.reindex(segment_results['sizes'].index)
+                        summary.columns = [f"Rank {p}" for p in summary.columns]
+                        summary.insert(0, 'Customers', segment_results['sizes'].values)
+                        summary['Sama dengan Global'] = summary['Rank 1'] == topsis_results.index[0]
+                        st.dataframe(summary, use_container_width=True)
+                        
+                        if segment_results['skipped']:
+                            st.caption(f"{segment_results['skipped']} segmen kecil tidak dianalisis.")
+                        show_download_button(segment_rankings, "segment_topsis_results", index=False,
+                                             label="Download Ranking per Segmen")
+        
         except Exception as e:
             st.error(f"Error menghitung TOPSIS: {str(e)}")
-            st.stop()
+            stop()
         
         st.markdown("<br>", unsafe_allow_html=True)
         
@@ -579,6 +830,14 @@ def main():
             </div>
             """, unsafe_allow_html=True)
             
+            export_format = st.radio(
+                "Format file",
+                ["csv", "parquet", "feather"],
+                format_func=lambda f: {"csv": "CSV", "parquet": "Parquet", "feather": "Feather (Arrow)"}[f],
+                horizontal=True,
+                help="Parquet/Feather jauh lebih kecil dan cepat dibaca ulang untuk hasil yang besar"
+            )
+            
             col1, col2, col3 = st.columns(3)
             
             with col1:
@@ -590,14 +849,8 @@ def main():
                 </div>
                 """, unsafe_allow_html=True)
                 
-                csv_topsis = topsis_results.to_csv()
-                st.download_button(
-                    "Download CSV",
-                    csv_topsis,
-                    "topsis_results.csv",
-                    "text/csv",
-                    use_container_width=True
-                )
+                show_download_button(topsis_results, "topsis_results", export_format,
+                                     use_container_width=True)
             
             with col2:
                 st.markdown("""
@@ -608,14 +861,8 @@ def main():
                 </div>
                 """, unsafe_allow_html=True)
                 
-                csv_matrix = decision_matrix.to_csv()
-                st.download_button(
-                    "Download CSV",
-                    csv_matrix,
-                    "decision_matrix.csv",
-                    "text/csv",
-                    use_container_width=True
-                )
+                show_download_button(decision_matrix, "decision_matrix", export_format,
+                                     use_container_width=True)
             
             with col3:
                 st.markdown("""
@@ -630,14 +877,8 @@ def main():
                     {'Model Feature': k, 'Dataset Column': v}
                     for k, v in mapping_detail.items()
                 ])
-                csv_mapping = mapping_df.to_csv(index=False)
-                st.download_button(
-                    "Download CSV",
-                    csv_mapping,
-                    "feature_mapping.csv",
-                    "text/csv",
-                    use_container_width=True
-                )
+                show_download_button(mapping_df, "feature_mapping", export_format, index=False,
+                                     use_container_width=True)
     
     # ==============================================================================
     # USER GUIDE PAGE
@@ -661,7 +902,7 @@ def main():
         
         if 'df' not in st.session_state:
             st.warning("Belum ada data yang di-upload. Silakan upload dataset terlebih dahulu di halaman Home.")
-            st.stop()
+            stop()
         
         # Summary Statistics
         st.markdown("""
@@ -673,10 +914,17 @@ def main():
         
         df = st.session_state.df
         
+        # Profil dataset dibangun sekali saat upload (satu pass per chunk); setiap render
+        # dashboard hanya membaca ringkasannya, tidak memindai ulang dataset
+        if st.session_state.get('aggregates') is None:
+            st.session_state.aggregates = DatasetProfile.from_dataframe(df)
+        profile = st.session_state.aggregates
+        null_counts = profile.null_counts.reindex(df.columns, fill_value=0)
+        
         col1, col2, col3, col4 = st.columns(4)
         
         with col1:
-            create_metric_card("Total Records", f"{len(df):,}")
+            create_metric_card("Total Records", f"{profile.n_rows:,}")
         
         with col2:
             create_metric_card("Total Columns", f"{len(df.columns)}")
@@ -688,7 +936,7 @@ def main():
                 create_metric_card("Matched Features", "N/A")
         
         with col4:
-            missing_pct = (df.isnull().sum().sum() / (len(df) * len(df.columns)) * 100)
+            missing_pct = (null_counts.sum() / max(profile.n_rows * len(df.columns), 1) * 100)
             create_metric_card("Missing Data", f"{missing_pct:.1f}%")
         
         # Data Quality Check
@@ -706,8 +954,8 @@ def main():
             st.markdown("#### Missing Values per Column")
             missing_df = pd.DataFrame({
                 'Column': df.columns,
-                'Missing': df.isnull().sum().values,
-                'Percentage': (df.isnull().sum().values / len(df) * 100)
+                'Missing': null_counts.values,
+                'Percentage': (null_counts.values / max(profile.n_rows, 1) * 100)
             }).sort_values('Missing', ascending=False)
             
             missing_df = missing_df[missing_df['Missing'] > 0]
@@ -722,7 +970,7 @@ def main():
         
         with col2:
             st.markdown("#### Data Types")
-            dtype_counts = df.dtypes.value_counts()
+            dtype_counts = profile.dtype_counts
             
             import plotly.graph_objects as go
             
@@ -737,12 +985,27 @@ def main():
                 height=400
             )
             
-            st.plotly_chart(fig, use_container_width=True)
+            with span("render:dtype_chart"):
+                st.plotly_chart(fig, use_container_width=True)
         
-        # Descriptive Statistics
+        # Data Explorer
         st.markdown("<br>", unsafe_allow_html=True)
+        with st.expander("Data Explorer", expanded=False):
+            show_dataset_preview(get_dataset_preview(df), key="dashboard_preview")
+        
+        # Descriptive Statistics
         with st.expander("Descriptive Statistics", expanded=False):
-            st.dataframe(df.describe(), use_container_width=True)
+            st.dataframe(profile.describe(), use_container_width=True)
+            if not profile.quantiles_exact:
+                st.caption("Kuantil (25%/50%/75%) adalah perkiraan t-digest; count/mean/std/min/max eksak.")
+            
+            st.markdown("#### Profil Kolom")
+            st.dataframe(
+                profile.column_summary().style.format({'Missing (%)': '{:.2f}', 'Distinct (≈)': '{:,}'}),
+                use_container_width=True,
+                hide_index=True
+            )
+            st.caption("Distinct (≈) adalah perkiraan HyperLogLog (galat standar ~1.6%).")
     
     # ==============================================================================
     # ABOUT PAGE
@@ -750,6 +1013,11 @@ def main():
     elif page == "About":
         st.markdown("<br>", unsafe_allow_html=True)
         show_about()
+    
+    # ==============================================================================
+    # PERFORMANCE PANEL
+    # ==============================================================================
+    render_performance_panel()
 
 if __name__ == '__main__':
     main()
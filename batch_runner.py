@@ -0,0 +1,190 @@
+"""
+Batch runner headless: analisis mapping -> importance -> TOPSIS untuk banyak outlet
+sekaligus tanpa Streamlit, dengan satu file hasil gabungan.
+
+Contoh:
+    python batch_runner.py data/outlets/ --output hasil_topsis.csv --workers 8
+    python batch_runner.py "data/*.parquet" --importance global --top-k 10 --output hasil.parquet
+
+Input boleh CSV, Parquet atau Arrow/Feather; format output mengikuti ekstensi --output.
+
+Setiap worker di process pool memuat model dan preprocessor acuan satu kali (initializer);
+pada platform dengan fork, model yang sudah dimuat proses induk dipakai bersama (copy-on-write).
+XGBoost dijalankan 1 thread per worker agar throughput naik linear dengan jumlah core.
+"""
+import argparse
+import glob
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from data_loader import FORMAT_EXTENSIONS, write_dataframe
+from data_mapping import get_cached_model_features
+from errors import ModelLoadError
+from pipeline import build_decision_matrix, compute_importance, load_dataset, map_features, rank_strategies
+from scoring import get_reference_preprocessor, set_model_threads
+
+DEFAULT_MODEL_FILE = "model_satisfied_v2.pkl"
+DEFAULT_FEATURE_NAMES_FILE = "feature_names.pkl"
+
+# State per proses worker (diisi oleh _init_worker)
+_WORKER: Dict = {}
+
+def discover_inputs(patterns: List[str]) -> List[str]:
+    """Kumpulkan file dataset dari daftar direktori, path, atau pola glob (terurut, tanpa duplikat)"""
+    paths = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            for ext in FORMAT_EXTENSIONS:
+                paths.extend(glob.glob(os.path.join(pattern, f"*{ext}")))
+        else:
+            paths.extend(glob.glob(pattern))
+    return sorted(dict.fromkeys(os.path.abspath(p) for p in paths if os.path.isfile(p)))
+
+def _init_worker(model_file: str, feature_names_file: str, n_threads: Optional[int]) -> None:
+    model, feature_names = get_cached_model_features(model_file, feature_names_file)
+    set_model_threads(model, n_threads)
+    # Preprocessor di-fit sekali pada dataset acuan (ikut diwarisi worker hasil fork)
+    get_reference_preprocessor(feature_names)
+    _WORKER.update(model=model, feature_names=feature_names)
+
+def analyze_file(path: str,
+                 importance_source: str = "shap",
+                 source: Optional[str] = None,
+                 min_features: int = 5,
+                 top_k: Optional[int] = None) -> Tuple[Optional[pd.DataFrame], Dict]:
+    """
+    Analisis satu file outlet dengan step yang sama seperti app.
+    Return: (ranking strategi atau None, ringkasan status)
+    """
+    start = time.perf_counter()
+    outlet = os.path.splitext(os.path.basename(path))[0]
+    summary = {'Outlet': outlet, 'File': path, 'Status': 'ok', 'Message': '',
+               'Rows': 0, 'Features_Matched': 0, 'Strategies': 0}
+    try:
+        model, feature_names = _WORKER['model'], _WORKER['feature_names']
+        # Selalu proyeksi kolom: hanya kolom yang dipakai mapping yang di-parse
+        dataset = load_dataset(path, feature_names, source, large_file_bytes=0)
+        summary['Rows'] = len(dataset['df'])
+
+        mapping = map_features(dataset, feature_names, source, min_features=min_features)
+        summary['Features_Matched'] = mapping['num_matched']
+        summary['Message'] = mapping['message']
+        if not mapping['is_valid']:
+            summary['Status'] = 'invalid'
+            return None, summary
+
+        importances = compute_importance(model, mapping, feature_names, importance_source)
+        results = rank_strategies(build_decision_matrix(importances))
+        if results is None:
+            summary['Status'] = 'no_strategy'
+            summary['Message'] = "Tidak ada strategi yang cocok dengan features yang terdeteksi."
+            return None, summary
+
+        summary['Strategies'] = len(results)
+        if top_k is not None:
+            results = results.head(top_k)
+        results = results.reset_index()
+        results.insert(0, 'Outlet', outlet)
+        return results, summary
+    except Exception as e:
+        summary['Status'] = 'error'
+        summary['Message'] = str(e)
+        return None, summary
+    finally:
+        summary['Seconds'] = round(time.perf_counter() - start, 3)
+
+def run_batch(paths: List[str],
+              model_file: str = DEFAULT_MODEL_FILE,
+              feature_names_file: str = DEFAULT_FEATURE_NAMES_FILE,
+              workers: Optional[int] = None,
+              threads_per_worker: Optional[int] = 1,
+              **analysis_kwargs) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Jalankan analyze_file untuk semua path di process pool.
+    Return: (ranking gabungan semua outlet, ringkasan per outlet)
+    """
+    workers = workers or os.cpu_count() or 1
+    # Muat model di proses induk agar worker hasil fork langsung memakai registry yang sama
+    _init_worker(model_file, feature_names_file, threads_per_worker)
+
+    results, summaries = [], []
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(model_file, feature_names_file, threads_per_worker)) as executor:
+        futures = {executor.submit(analyze_file, path, **analysis_kwargs): path for path in paths}
+        for done, future in enumerate(as_completed(futures), 1):
+            ranking, summary = future.result()
+            summaries.append(summary)
+            if ranking is not None:
+                results.append(ranking)
+            print(f"[{done}/{len(paths)}] {summary['Status']:11} {summary['Outlet']} "
+                  f"({summary['Seconds']:.1f} s)", file=sys.stderr)
+
+    summary_df = pd.DataFrame(summaries).sort_values('Outlet').reset_index(drop=True)
+    ranking_df = (pd.concat(results, ignore_index=True).sort_values(['Outlet', 'Rank'], kind='stable')
+                  if results else pd.DataFrame(columns=['Outlet', 'Strategy', 'Closeness_Score', 'Rank']))
+    return ranking_df.reset_index(drop=True), summary_df
+
+def _summary_path(output: str) -> str:
+    stem, ext = os.path.splitext(output)
+    return f"{stem}_summary{ext or '.csv'}"
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Batch analisis TOPSIS untuk banyak outlet restoran")
+    parser.add_argument("inputs", nargs="+", help="Direktori, file, atau pola glob dataset pelanggan")
+    parser.add_argument("--output", default="topsis_batch_results.csv",
+                        help="File hasil gabungan .csv/.parquet/.feather "
+                             "(ringkasan ditulis ke <output>_summary.<ext>)")
+    parser.add_argument("--model", default=DEFAULT_MODEL_FILE)
+    parser.add_argument("--feature-names", default=DEFAULT_FEATURE_NAMES_FILE)
+    parser.add_argument("--workers", type=int, default=None, help="Jumlah proses (default: jumlah core)")
+    parser.add_argument("--threads-per-worker", type=int, default=1, help="Thread XGBoost per worker")
+    parser.add_argument("--importance", choices=["shap", "global"], default="shap",
+                        help="Sumber feature importance (default: SHAP pada data outlet)")
+    parser.add_argument("--source", default=None, help="Nama sumber data untuk sinonim kolom")
+    parser.add_argument("--min-features", type=int, default=5)
+    parser.add_argument("--top-k", type=int, default=None, help="Simpan hanya k strategi teratas per outlet")
+    args = parser.parse_args(argv)
+
+    paths = discover_inputs(args.inputs)
+    if not paths:
+        print("Tidak ada file dataset yang ditemukan.", file=sys.stderr)
+        return 1
+
+    # Direktori output disiapkan sebelum analisis, agar tidak gagal setelah semua outlet selesai
+    try:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    except OSError as e:
+        print(f"Direktori output tidak dapat dibuat: {e}", file=sys.stderr)
+        return 1
+
+    start = time.perf_counter()
+    try:
+        ranking_df, summary_df = run_batch(
+            paths,
+            model_file=args.model,
+            feature_names_file=args.feature_names,
+            workers=args.workers,
+            threads_per_worker=args.threads_per_worker,
+            importance_source=args.importance,
+            source=args.source,
+            min_features=args.min_features,
+            top_k=args.top_k,
+        )
+    except ModelLoadError as e:
+        print(str(e), file=sys.stderr)
+        return 1
+    write_dataframe(ranking_df, args.output, index=False)
+    write_dataframe(summary_df, _summary_path(args.output), index=False)
+
+    n_ok = int((summary_df['Status'] == 'ok').sum())
+    print(f"{n_ok}/{len(paths)} outlet berhasil dalam {time.perf_counter() - start:.1f} s -> {args.output}",
+          file=sys.stderr)
+    return 0 if n_ok == len(paths) else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,282 @@
+"""
+Benchmark pipeline mapping -> TOPSIS pada skala besar.
+
+Data sintetis dibangkitkan dari restaurant_customer_satisfaction.csv (resampling per kolom)
+dengan jumlah baris/kolom tertentu, ditambah katalog strategi sintetis. Per stage dicatat:
+- wall time (median dari --repeat kali)
+- peak RSS selama stage (VmHWM Linux yang di-reset per stage; fallback ru_maxrss proses)
+- peak alokasi Python/NumPy (tracemalloc, dijalankan terpisah dari pengukuran waktu)
+
+Contoh:
+    python benchmark.py                                  # profil quick
+    python benchmark.py --profile full --save-baseline   # simpan baseline baru
+    python benchmark.py --compare                        # exit 1 jika ada regresi
+
+Profil full mencakup 10M baris × 500 kolom; siapkan RAM yang cukup (puluhan GB).
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from data_mapping import (
+    StrategyCatalog,
+    build_topsis_matrix,
+    clear_mapping_cache,
+    map_dataset_to_features,
+)
+from topsis_utils import calculate_topsis
+
+TEMPLATE_FILE = "restaurant_customer_satisfaction.csv"
+FEATURE_NAMES_FILE = "feature_names.pkl"
+BASELINE_FILE = "benchmark_baseline.json"
+
+PROFILES = {
+    'quick': {'rows': [1_000, 100_000], 'cols': [20, 100], 'strategies': [60, 1_000]},
+    'full': {'rows': [1_000, 100_000, 1_000_000, 10_000_000], 'cols': [20, 100, 500],
+             'strategies': [60, 1_000, 10_000]},
+}
+
+# Regresi jika metrik naik lebih dari toleransi relatif terhadap baseline
+TIME_TOLERANCE = 0.25
+MEMORY_TOLERANCE = 0.25
+# Perubahan absolut di bawah batas ini diabaikan (noise pengukuran)
+MIN_TIME_DELTA = 0.005
+MIN_MEMORY_DELTA = 4 * 1024 * 1024
+
+# ======================================================================
+# GENERATOR DATA SINTETIS
+# ======================================================================
+def synthetic_customers(n_rows: int, n_cols: int, seed: int = 0,
+                        template_file: str = TEMPLATE_FILE) -> pd.DataFrame:
+    """
+    Dataset pelanggan sintetis: kolom dasar di-resample dari dataset contoh (distribusi
+    marginal sama), sisanya kolom tambahan seperti ekspor POS (blok one-hot dan metrik numerik).
+    """
+    rng = np.random.default_rng(seed)
+    template = pd.read_csv(template_file).drop(columns=['HighSatisfaction'], errors='ignore')
+    base_cols = list(template.columns[:n_cols])
+
+    data = {}
+    for col in base_cols:
+        values = template[col].to_numpy()
+        data[col] = values[rng.integers(0, len(values), n_rows)]
+    if 'CustomerID' in data:
+        data['CustomerID'] = np.arange(1, n_rows + 1)
+
+    n_extra = n_cols - len(base_cols)
+    n_onehot = n_extra // 2
+    if n_onehot:
+        hot = rng.integers(0, n_onehot, n_rows)
+        for i in range(n_onehot):
+            data[f'Cuisine_OneHot_{i}'] = (hot == i).astype(np.int8)
+    for i in range(n_extra - n_onehot):
+        data[f'Metric_{i}'] = rng.standard_normal(n_rows).astype(np.float32)
+    return pd.DataFrame(data)
+
+def synthetic_catalog(n_strategies: int, features: List[str], seed: int = 0,
+                      features_per_strategy: Tuple[int, int] = (4, 10)) -> StrategyCatalog:
+    """Katalog strategi sintetis: setiap strategi memakai 4-10 feature acak dengan bobot acak"""
+    rng = np.random.default_rng(seed)
+    mapping = {}
+    for i in range(n_strategies):
+        k = int(rng.integers(features_per_strategy[0], min(features_per_strategy[1], len(features)) + 1))
+        chosen = rng.choice(len(features), size=k, replace=False)
+        weights = rng.dirichlet(np.ones(k))
+        mapping[f"S{i:05d}: Synthetic Strategy"] = {
+            'features': {features[j]: float(w) for j, w in zip(chosen, weights)},
+            'description': '',
+            'implementation': [],
+        }
+    return StrategyCatalog.from_mapping(mapping)
+
+# ======================================================================
+# PENGUKURAN
+# ======================================================================
+def _reset_peak_rss() -> bool:
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+def _peak_rss_bytes() -> int:
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS melaporkan byte, Linux kilobyte
+    return peak if platform.system() == "Darwin" else peak * 1024
+
+def measure(func: Callable, repeat: int = 3, track_allocations: bool = True,
+            setup: Optional[Callable] = None) -> Tuple[Dict, object]:
+    """
+    Ukur satu stage. setup() dipanggil sebelum setiap eksekusi (mis. kosongkan cache).
+    Return: (metrik, hasil eksekusi terakhir)
+    """
+    times = []
+    result = None
+    _reset_peak_rss()
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - start)
+    metrics = {'seconds': float(np.median(times)), 'peak_rss_bytes': _peak_rss_bytes()}
+
+    if track_allocations:
+        if setup is not None:
+            setup()
+        tracemalloc.start()
+        try:
+            func()
+            metrics['alloc_peak_bytes'] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return metrics, result
+
+def run_benchmarks(rows: List[int], cols: List[int], strategies: List[int],
+                   repeat: int = 3, track_allocations: bool = True, seed: int = 0,
+                   log: Callable[[str], None] = print) -> Dict[str, Dict[str, Dict]]:
+    """
+    Jalankan semua kombinasi. Return {case_id: {stage: metrik}}.
+    Mapping diukur dalam kondisi cold (cache mapping dikosongkan sebelum setiap eksekusi).
+    """
+    import joblib
+
+    feature_names = joblib.load(FEATURE_NAMES_FILE)
+    rng = np.random.default_rng(seed)
+    results: Dict[str, Dict[str, Dict]] = {}
+
+    for n_rows in rows:
+        for n_cols in cols:
+            df = synthetic_customers(n_rows, n_cols, seed=seed)
+            case = f"rows={n_rows},cols={n_cols}"
+            metrics, mapped = measure(lambda: map_dataset_to_features(df, feature_names),
+                                      repeat, track_allocations, setup=clear_mapping_cache)
+            results[case] = {'map_dataset_to_features': metrics}
+            log(_format(case, 'map_dataset_to_features', metrics))
+            del df
+
+            matched_features = [mf for mf in mapped[4] if mf in feature_names]
+            importances = dict(zip(matched_features, rng.dirichlet(np.ones(len(matched_features)))))
+            for n_strategies in strategies:
+                catalog = synthetic_catalog(n_strategies, feature_names, seed=seed)
+                case_s = f"{case},strategies={n_strategies}"
+                metrics, matrix = measure(lambda: build_topsis_matrix(matched_features, importances, catalog),
+                                          repeat, track_allocations)
+                results[case_s] = {'build_topsis_matrix': metrics}
+                log(_format(case_s, 'build_topsis_matrix', metrics))
+
+                decision_matrix, weights, criteria_types = matrix
+                if decision_matrix is None:
+                    continue
+                metrics, _ = measure(lambda: calculate_topsis(decision_matrix, weights, criteria_types),
+                                     repeat, track_allocations)
+                results[case_s]['calculate_topsis'] = metrics
+                log(_format(case_s, 'calculate_topsis', metrics))
+    return results
+
+def _format(case: str, stage: str, metrics: Dict) -> str:
+    alloc = metrics.get('alloc_peak_bytes')
+    return (f"{case:42} {stage:25} {metrics['seconds'] * 1000:10.1f} ms"
+            f"  rss {metrics['peak_rss_bytes'] / 1e6:8.1f} MB"
+            + (f"  alloc {alloc / 1e6:8.1f} MB" if alloc is not None else ""))
+
+# ======================================================================
+# BASELINE
+# ======================================================================
+def load_baseline(path: str = BASELINE_FILE) -> Dict:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def save_baseline(results: Dict, path: str = BASELINE_FILE) -> None:
+    payload = {
+        'meta': {'python': platform.python_version(), 'machine': platform.machine(),
+                 'cpus': os.cpu_count(), 'created': time.strftime("%Y-%m-%d %H:%M:%S")},
+        'results': results,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=2)
+
+def compare(results: Dict, baseline: Dict,
+            time_tolerance: float = TIME_TOLERANCE,
+            memory_tolerance: float = MEMORY_TOLERANCE) -> List[Dict]:
+    """Daftar regresi: metrik yang naik melewati toleransi terhadap baseline"""
+    checks = [('seconds', time_tolerance, MIN_TIME_DELTA),
+              ('peak_rss_bytes', memory_tolerance, MIN_MEMORY_DELTA),
+              ('alloc_peak_bytes', memory_tolerance, MIN_MEMORY_DELTA)]
+    regressions = []
+    for case, stages in results.items():
+        for stage, metrics in stages.items():
+            base = baseline.get('results', {}).get(case, {}).get(stage)
+            if base is None:
+                continue
+            for metric, tolerance, min_delta in checks:
+                if metric not in metrics or metric not in base:
+                    continue
+                new, old = metrics[metric], base[metric]
+                if new - old > min_delta and new > old * (1 + tolerance):
+                    regressions.append({'case': case, 'stage': stage, 'metric': metric,
+                                        'baseline': old, 'current': new,
+                                        'change': new / old - 1 if old else float('inf')})
+    return regressions
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark mapping -> TOPSIS")
+    parser.add_argument("--profile", choices=list(PROFILES), default="quick")
+    parser.add_argument("--rows", type=int, nargs="+", help="Override jumlah baris")
+    parser.add_argument("--cols", type=int, nargs="+", help="Override jumlah kolom")
+    parser.add_argument("--strategies", type=int, nargs="+", help="Override ukuran katalog strategi")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--no-alloc", action="store_true", help="Lewati pengukuran tracemalloc")
+    parser.add_argument("--baseline", default=BASELINE_FILE)
+    parser.add_argument("--save-baseline", action="store_true", help="Simpan hasil sebagai baseline")
+    parser.add_argument("--compare", action="store_true", help="Bandingkan dengan baseline (exit 1 jika regresi)")
+    parser.add_argument("--time-tolerance", type=float, default=TIME_TOLERANCE)
+    parser.add_argument("--memory-tolerance", type=float, default=MEMORY_TOLERANCE)
+    parser.add_argument("--output", help="Simpan hasil mentah ke file JSON")
+    args = parser.parse_args(argv)
+
+    profile = PROFILES[args.profile]
+    results = run_benchmarks(args.rows or profile['rows'], args.cols or profile['cols'],
+                             args.strategies or profile['strategies'],
+                             repeat=args.repeat, track_allocations=not args.no_alloc)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    if args.save_baseline:
+        save_baseline(results, args.baseline)
+        print(f"Baseline disimpan ke {args.baseline}")
+
+    if args.compare:
+        if not os.path.exists(args.baseline):
+            print(f"Baseline {args.baseline} tidak ditemukan", file=sys.stderr)
+            return 1
+        regressions = compare(results, load_baseline(args.baseline),
+                              args.time_tolerance, args.memory_tolerance)
+        for r in regressions:
+            print(f"REGRESI {r['case']} {r['stage']} {r['metric']}: "
+                  f"{r['baseline']:.4g} -> {r['current']:.4g} (+{r['change']:.0%})")
+        if regressions:
+            return 1
+        print("Tidak ada regresi terhadap baseline.")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,346 @@
+import csv
+import io
+import os
+import pandas as pd
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+from pandas.api.types import union_categoricals
+
+from dataset_profile import DatasetProfile
+from instrumentation import instrument
+
+# ======================================================================
+# INGESTION DATASET PELANGGAN
+# ======================================================================
+SNIFF_BYTES = 64 * 1024
+DEFAULT_CHUNKSIZE = 200_000
+CANDIDATE_DELIMITERS = ",;\t|"
+
+def _rewind(source) -> None:
+    if hasattr(source, "seek"):
+        source.seek(0)
+
+def _read_head(source, n_bytes: int = SNIFF_BYTES) -> str:
+    """Ambil sampel kecil dari awal file (path atau file-like) tanpa membaca seluruh file"""
+    if isinstance(source, (str, bytes)) or hasattr(source, "__fspath__"):
+        with open(source, "rb") as f:
+            head = f.read(n_bytes)
+    else:
+        _rewind(source)
+        head = source.read(n_bytes)
+        _rewind(source)
+    if isinstance(head, bytes):
+        head = head.decode("utf-8", errors="replace")
+    return head
+
+def sniff_delimiter(source) -> str:
+    """
+    Deteksi delimiter dari sampel kepala file saja (bukan seluruh file seperti sep=None)
+    """
+    head = _read_head(source)
+    # Buang baris terakhir yang mungkin terpotong
+    sample = head.rsplit("\n", 1)[0] if "\n" in head else head
+    try:
+        return csv.Sniffer().sniff(sample, delimiters=CANDIDATE_DELIMITERS).delimiter
+    except csv.Error:
+        return ","
+
+def read_csv_header(source, sep: Optional[str] = None) -> List[str]:
+    """Baca nama kolom saja"""
+    sep = sep or sniff_delimiter(source)
+    _rewind(source)
+    columns = list(pd.read_csv(io.StringIO(_read_head(source)), sep=sep, nrows=0).columns)
+    _rewind(source)
+    return columns
+
+# ======================================================================
+# FORMAT FILE (CSV / PARQUET / ARROW IPC)
+# ======================================================================
+# Ekstensi -> format; file tanpa ekstensi yang dikenal dideteksi dari magic bytes
+FORMAT_EXTENSIONS = {
+    ".csv": "csv", ".tsv": "csv",
+    ".parquet": "parquet", ".pq": "parquet",
+    ".feather": "feather", ".arrow": "feather", ".ipc": "feather",
+}
+UPLOAD_EXTENSIONS = [ext.lstrip(".") for ext in FORMAT_EXTENSIONS]
+_MAGIC_BYTES = {b"PAR1": "parquet", b"ARROW1": "feather"}
+
+def _source_name(source) -> str:
+    if isinstance(source, (str, bytes)) or hasattr(source, "__fspath__"):
+        return os.fsdecode(source)
+    return getattr(source, "name", "") or ""
+
+def detect_format(source) -> str:
+    """Format dataset: 'csv', 'parquet' atau 'feather' (Arrow IPC), dari ekstensi lalu magic bytes"""
+    ext = os.path.splitext(_source_name(source))[1].lower()
+    if ext in FORMAT_EXTENSIONS:
+        return FORMAT_EXTENSIONS[ext]
+    if isinstance(source, (str, bytes)) or hasattr(source, "__fspath__"):
+        with open(source, "rb") as f:
+            magic = f.read(6)
+    else:
+        _rewind(source)
+        magic = source.read(6)
+        _rewind(source)
+    for prefix, fmt in _MAGIC_BYTES.items():
+        if magic.startswith(prefix):
+            return fmt
+    return "csv"
+
+def _open_columnar(source, fmt: str):
+    """Reader pyarrow: ParquetFile atau RecordBatchFileReader (memory-mapped jika path)"""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    _rewind(source)
+    if fmt == "parquet":
+        return pq.ParquetFile(source)
+    if isinstance(source, (str, bytes)) or hasattr(source, "__fspath__"):
+        source = pa.memory_map(os.fsdecode(source), "r")
+    return pa.ipc.open_file(source)
+
+def read_dataset_header(source) -> List[str]:
+    """Nama kolom dataset; untuk Parquet/Arrow cukup membaca schema (metadata) file"""
+    fmt = detect_format(source)
+    if fmt == "csv":
+        return read_csv_header(source)
+    reader = _open_columnar(source, fmt)
+    columns = list(reader.schema_arrow.names if fmt == "parquet" else reader.schema.names)
+    _rewind(source)
+    return columns
+
+def _pyarrow_available() -> bool:
+    try:
+        import pyarrow  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+# ======================================================================
+# KOMPAKSI DTYPE
+# ======================================================================
+# Kolom string low-cardinality pada skema dataset restoran
+CATEGORICAL_COLUMNS = ["Gender", "PreferredCuisine", "TimeOfVisit",
+                       "DiningOccasion", "MealType", "VisitFrequency"]
+# Kolom string lain dijadikan category jika rasio nilai unik <= batas ini
+MAX_CATEGORY_RATIO = 0.5
+
+def optimize_dtypes(df: pd.DataFrame,
+                    categorical_columns: Optional[List[str]] = None,
+                    max_category_ratio: float = MAX_CATEGORY_RATIO) -> Tuple[pd.DataFrame, Dict]:
+    """
+    Kompaksi dtype dataframe:
+    - string low-cardinality -> category
+    - integer (rating 1-5, flag 0/1, dst) -> integer terkecil yang muat (int8 untuk rating/flag)
+    - float (ukuran numerik) -> float32
+    Return: (dataframe, laporan memori {'before_bytes', 'after_bytes', 'saved_bytes', 'columns'})
+    """
+    categorical_columns = set(CATEGORICAL_COLUMNS if categorical_columns is None else categorical_columns)
+    before = int(df.memory_usage(deep=True).sum())
+    
+    converted = {}
+    changes = {}
+    for col in df.columns:
+        s = df[col]
+        old_dtype = str(s.dtype)
+        if pd.api.types.is_bool_dtype(s) or isinstance(s.dtype, pd.CategoricalDtype):
+            continue
+        if pd.api.types.is_integer_dtype(s):
+            new = pd.to_numeric(s, downcast="integer")
+        elif pd.api.types.is_float_dtype(s):
+            new = s.astype(np.float32)
+        elif pd.api.types.is_object_dtype(s) or pd.api.types.is_string_dtype(s):
+            n_unique = s.nunique(dropna=True)
+            if col in categorical_columns or n_unique <= max_category_ratio * max(len(s), 1):
+                new = s.astype("category")
+            else:
+                continue
+        else:
+            continue
+        if str(new.dtype) != old_dtype:
+            converted[col] = new
+            changes[col] = (old_dtype, str(new.dtype))
+    
+    if converted:
+        df = df.assign(**converted)
+    after = int(df.memory_usage(deep=True).sum())
+    
+    report = {
+        'before_bytes': before,
+        'after_bytes': after,
+        'saved_bytes': before - after,
+        'columns': changes
+    }
+    return df, report
+
+def _concat_chunks(chunks: List[pd.DataFrame]) -> pd.DataFrame:
+    """Gabungkan chunk; kolom category disatukan dengan union_categoricals agar tidak jadi object"""
+    columns = list(chunks[0].columns)
+    cat_cols = [c for c in columns
+                if any(isinstance(ch[c].dtype, pd.CategoricalDtype) for ch in chunks)]
+    df = pd.concat([ch.drop(columns=cat_cols) for ch in chunks], ignore_index=True)
+    for col in cat_cols:
+        df[col] = union_categoricals([ch[col].astype("category") for ch in chunks], ignore_order=True)
+    return df[columns]
+
+class DatasetAggregates(DatasetProfile):
+    """
+    Profil dataset (lihat dataset_profile.DatasetProfile) yang diperbarui per chunk saat
+    dibaca, ditambah laporan memori kompaksi dtype. Dipakai dashboard tanpa memindai ulang data.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.memory_before_bytes = 0
+        self.memory_after_bytes = 0
+
+    def add_memory_report(self, report: Dict) -> None:
+        self.memory_before_bytes += report['before_bytes']
+        self.memory_after_bytes += report['after_bytes']
+
+    @property
+    def memory_saved_bytes(self) -> int:
+        return self.memory_before_bytes - self.memory_after_bytes
+
+@instrument("csv_parse", rows=lambda args, result: len(result[0]))
+def read_customer_csv(source,
+                      usecols: Optional[List[str]] = None,
+                      chunksize: Optional[int] = DEFAULT_CHUNKSIZE,
+                      engine: str = "auto",
+                      optimize: bool = False) -> Tuple[pd.DataFrame, DatasetAggregates]:
+    """
+    Membaca CSV pelanggan dengan engine C/pyarrow (bukan engine python).
+    - Delimiter dideteksi dari sampel kepala file
+    - usecols: proyeksi kolom, hanya kolom ini yang di-parse
+    - chunksize: dibaca per chunk dengan engine C sambil membangun agregat berjalan;
+      None + pyarrow tersedia = parsing multi-thread sekaligus
+    - optimize: kompaksi dtype per chunk (lihat optimize_dtypes), laporan memori di agregat
+    Return: (dataframe, agregat)
+    """
+    sep = sniff_delimiter(source)
+    if engine == "auto":
+        engine = "pyarrow" if chunksize is None and _pyarrow_available() else "c"
+
+    aggregates = DatasetAggregates()
+    _rewind(source)
+
+    if engine == "pyarrow":
+        df = pd.read_csv(source, sep=sep, usecols=usecols, engine="pyarrow")
+        aggregates.update(df)
+        if optimize:
+            df, report = optimize_dtypes(df)
+            aggregates.add_memory_report(report)
+        aggregates.set_dtypes(df.dtypes)
+        return df, aggregates
+
+    reader = pd.read_csv(source, sep=sep, usecols=usecols, engine="c",
+                         chunksize=chunksize or DEFAULT_CHUNKSIZE, low_memory=False)
+    chunks = []
+    for chunk in reader:
+        aggregates.update(chunk)
+        if optimize:
+            chunk, report = optimize_dtypes(chunk)
+            aggregates.add_memory_report(report)
+        chunks.append(chunk)
+
+    if not chunks:
+        df = pd.read_csv(io.StringIO(_read_head(source)), sep=sep, usecols=usecols, nrows=0)
+    elif len(chunks) == 1:
+        df = chunks[0]
+    else:
+        df = _concat_chunks(chunks)
+    aggregates.set_dtypes(df.dtypes)
+    return df, aggregates
+
+def _iter_record_batches(reader, fmt: str, usecols: Optional[List[str]], chunksize: int):
+    if fmt == "parquet":
+        yield from reader.iter_batches(batch_size=chunksize, columns=usecols)
+        return
+    for i in range(reader.num_record_batches):
+        batch = reader.get_batch(i)
+        if usecols is not None:
+            batch = batch.select(usecols)
+        for offset in range(0, batch.num_rows, chunksize):
+            yield batch.slice(offset, chunksize)
+
+@instrument("columnar_read", rows=lambda args, result: len(result[0]))
+def read_customer_columnar(source,
+                           usecols: Optional[List[str]] = None,
+                           chunksize: Optional[int] = DEFAULT_CHUNKSIZE,
+                           optimize: bool = False) -> Tuple[pd.DataFrame, DatasetAggregates]:
+    """
+    Membaca dataset pelanggan Parquet / Arrow IPC (Feather v2) per record batch.
+    - usecols: proyeksi kolom didorong ke reader, kolom lain tidak dibaca/didekompresi
+    - agregat berjalan dan kompaksi dtype per batch, sama seperti read_customer_csv;
+      dengan optimize, kolom string langsung dikonversi Arrow -> category (tanpa object)
+    Return: (dataframe, agregat)
+    """
+    fmt = detect_format(source)
+    reader = _open_columnar(source, fmt)
+    aggregates = DatasetAggregates()
+
+    chunks = []
+    for batch in _iter_record_batches(reader, fmt, usecols, chunksize or DEFAULT_CHUNKSIZE):
+        chunk = batch.to_pandas(strings_to_categorical=optimize)
+        aggregates.update(chunk)
+        if optimize:
+            chunk, report = optimize_dtypes(chunk)
+            aggregates.add_memory_report(report)
+        chunks.append(chunk)
+    _rewind(source)
+
+    if not chunks:
+        schema = reader.schema_arrow if fmt == "parquet" else reader.schema
+        df = schema.empty_table().to_pandas()
+        df = df[usecols] if usecols is not None else df
+    elif len(chunks) == 1:
+        df = chunks[0]
+    else:
+        df = _concat_chunks(chunks)
+    aggregates.set_dtypes(df.dtypes)
+    return df, aggregates
+
+def read_customer_data(source,
+                       usecols: Optional[List[str]] = None,
+                       optimize: bool = False,
+                       **kwargs) -> Tuple[pd.DataFrame, DatasetAggregates]:
+    """Baca dataset pelanggan CSV, Parquet atau Arrow IPC (format dideteksi otomatis)"""
+    if detect_format(source) == "csv":
+        return read_customer_csv(source, usecols=usecols, optimize=optimize, **kwargs)
+    kwargs.pop("engine", None)
+    return read_customer_columnar(source, usecols=usecols, optimize=optimize, **kwargs)
+
+# ======================================================================
+# EKSPOR HASIL
+# ======================================================================
+# format -> (MIME type, ekstensi file)
+EXPORT_FORMATS = {
+    "csv": ("text/csv", ".csv"),
+    "parquet": ("application/vnd.apache.parquet", ".parquet"),
+    "feather": ("application/vnd.apache.arrow.file", ".feather"),
+}
+
+def write_dataframe(df: pd.DataFrame, target, fmt: Optional[str] = None, index: bool = True) -> None:
+    """
+    Tulis dataframe ke path atau buffer sebagai CSV / Parquet / Feather.
+    fmt None = ditentukan dari ekstensi path (default CSV).
+    """
+    if fmt is None:
+        fmt = FORMAT_EXTENSIONS.get(os.path.splitext(_source_name(target))[1].lower(), "csv")
+    if fmt == "csv":
+        df.to_csv(target, index=index)
+    elif fmt == "parquet":
+        df.to_parquet(target, index=index)
+    elif fmt == "feather":
+        # Feather tidak menyimpan index: index dijadikan kolom biasa
+        df = df.reset_index() if index else df.reset_index(drop=True)
+        df.columns = [str(c) for c in df.columns]
+        df.to_feather(target)
+    else:
+        raise ValueError(f"Format ekspor tidak dikenal: {fmt}")
+
+def export_bytes(df: pd.DataFrame, fmt: str = "csv", index: bool = True) -> bytes:
+    """Serialisasi dataframe ke bytes (untuk download_button)"""
+    buffer = io.BytesIO()
+    write_dataframe(df, buffer, fmt, index=index)
+    return buffer.getvalue()
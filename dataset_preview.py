@@ -0,0 +1,117 @@
+from collections import OrderedDict
+from typing import Dict, Hashable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# ======================================================================
+# PREVIEW DATASET SERVER-SIDE (PAGINASI + INDEX SORT/FILTER)
+# ======================================================================
+# Dataframe tetap di server; yang dikirim ke browser hanya satu halaman baris.
+# Sort dan filter disimpan sebagai array posisi baris (bukan salinan dataframe)
+# dan di-cache per kolom/kondisi, sehingga ganti halaman = satu iloc kecil.
+
+DEFAULT_PAGE_SIZE = 25
+PAGE_SIZE_OPTIONS = [10, 25, 50, 100, 250]
+
+# Filter: (kolom, operator, nilai)
+#   '=='       nilai sama (kolom kategori / string)
+#   'contains' substring tanpa membedakan huruf besar/kecil (kolom string)
+#   'between'  (batas_bawah, batas_atas) inklusif (kolom numerik)
+FilterSpec = Tuple[str, str, Hashable]
+
+class DatasetPreview:
+    """
+    Index baris untuk preview satu dataframe: urutan per kolom (argsort) dan mask filter
+    dihitung sekali lalu di-cache (LRU), kombinasi sort+filter juga di-cache.
+    """
+
+    def __init__(self, df: pd.DataFrame, max_entries: int = 8):
+        self.df = df
+        self.max_entries = max_entries
+        self._cache: "OrderedDict[Tuple, np.ndarray]" = OrderedDict()
+        self._options: Dict[str, Dict] = {}
+
+    @property
+    def n_rows(self) -> int:
+        return len(self.df)
+
+    def _cached(self, key: Tuple, compute) -> np.ndarray:
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+        result = compute()
+        self._cache[key] = result
+        while len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+        return result
+
+    def sort_index(self, column: str, ascending: bool = True) -> np.ndarray:
+        """Posisi baris terurut menurut kolom (stabil, NaN selalu di akhir)"""
+        def compute():
+            series = self.df[column]
+            if isinstance(series.dtype, pd.CategoricalDtype) and not series.cat.ordered:
+                # Urutkan kategori menurut label, bukan urutan kemunculan
+                series = series.cat.reorder_categories(sorted(series.cat.categories, key=str), ordered=True)
+            ordered = series.reset_index(drop=True).sort_values(ascending=ascending, kind="stable",
+                                                                 na_position="last")
+            return ordered.index.to_numpy()
+        return self._cached(("sort", column, ascending), compute)
+
+    def filter_mask(self, spec: FilterSpec) -> np.ndarray:
+        """Mask boolean baris yang lolos filter"""
+        column, op, value = spec
+
+        def compute():
+            series = self.df[column]
+            if op == "==":
+                return (series == value).to_numpy(dtype=bool, na_value=False)
+            if op == "contains":
+                return series.astype(str).str.contains(str(value), case=False, regex=False).to_numpy(dtype=bool)
+            if op == "between":
+                low, high = value
+                return series.between(low, high).to_numpy(dtype=bool, na_value=False)
+            raise ValueError(f"Operator filter tidak dikenal: {op}")
+        return self._cached(("filter", column, op, value), compute)
+
+    def view(self, sort: Optional[Tuple[str, bool]] = None,
+             filters: Optional[List[FilterSpec]] = None) -> np.ndarray:
+        """Posisi baris (urutan tampilan) untuk kombinasi sort + filter"""
+        filters = tuple(filters or ())
+
+        def compute():
+            positions = self.sort_index(*sort) if sort is not None else np.arange(self.n_rows)
+            if not filters:
+                return positions
+            mask = np.ones(self.n_rows, dtype=bool)
+            for spec in filters:
+                mask &= self.filter_mask(spec)
+            return positions[mask[positions]]
+        return self._cached(("view", sort, filters), compute)
+
+    def page(self, positions: np.ndarray, page: int, page_size: int = DEFAULT_PAGE_SIZE) -> pd.DataFrame:
+        """Satu halaman baris (page mulai dari 1)"""
+        start = (max(page, 1) - 1) * page_size
+        return self.df.iloc[positions[start:start + page_size]]
+
+    @staticmethod
+    def n_pages(n_rows: int, page_size: int = DEFAULT_PAGE_SIZE) -> int:
+        return max(1, -(-n_rows // page_size))
+
+    def filter_options(self, column: str, max_values: int = 200) -> Dict:
+        """Jenis widget filter untuk kolom: rentang numerik, pilihan nilai, atau teks (di-cache)"""
+        if column not in self._options:
+            self._options[column] = self._filter_options(column, max_values)
+        return self._options[column]
+
+    def _filter_options(self, column: str, max_values: int) -> Dict:
+        series = self.df[column]
+        if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+            return {'kind': 'between', 'min': series.min(), 'max': series.max()}
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            values = list(series.cat.categories)
+        else:
+            values = list(pd.unique(series.dropna())[:max_values + 1])
+        if len(values) <= max_values:
+            return {'kind': '==', 'values': sorted(values, key=str)}
+        return {'kind': 'contains'}
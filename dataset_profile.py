@@ -0,0 +1,253 @@
+import math
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+# ======================================================================
+# PROFIL DATASET SATU PASS (SKETCH)
+# ======================================================================
+# DatasetProfile diperbarui per chunk saat dataset dibaca, sehingga dashboard
+# tidak perlu memindai ulang dataset: null count, min/max/mean/std (merge
+# paralel Chan), distinct count (HyperLogLog), dan kuantil (t-digest; eksak
+# selama jumlah nilai masih di bawah batas buffer).
+
+DESCRIBE_PERCENTILES = [0.25, 0.5, 0.75]
+
+def _bit_length(values: np.ndarray) -> np.ndarray:
+    """Panjang bit uint64 per elemen (vektorisasi, eksak: dipecah 2 x 32 bit agar muat di float64)"""
+    hi = (values >> np.uint64(32)).astype(np.float64)
+    lo = (values & np.uint64(0xFFFFFFFF)).astype(np.float64)
+    return np.where(hi > 0, 32 + np.frexp(hi)[1], np.frexp(lo)[1])
+
+class HyperLogLog:
+    """
+    Estimasi jumlah nilai unik dengan 2^p register (p=12: ~4 KB, galat standar ~1.6%).
+    Input berupa hash uint64 (mis. pd.util.hash_pandas_object).
+    """
+
+    def __init__(self, p: int = 12):
+        self.p = p
+        self.m = 1 << p
+        self.registers = np.zeros(self.m, dtype=np.uint8)
+
+    def add_hashes(self, hashes: np.ndarray) -> None:
+        if len(hashes) == 0:
+            return
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        index = (hashes >> np.uint64(64 - self.p)).astype(np.intp)
+        rest = hashes & np.uint64((1 << (64 - self.p)) - 1)
+        rank = ((64 - self.p) - _bit_length(rest) + 1).astype(np.uint8)
+        np.maximum.at(self.registers, index, rank)
+
+    def merge(self, other: "HyperLogLog") -> None:
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    def estimate(self) -> float:
+        m = self.m
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(np.int64)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if raw <= 2.5 * m and zeros > 0:
+            # Koreksi rentang kecil: linear counting
+            return m * math.log(m / zeros)
+        return float(raw)
+
+class TDigest:
+    """
+    t-digest (merging, fungsi skala k1) dengan merge tervektorisasi.
+    Nilai ditampung di buffer; selama total nilai <= buffer_size kuantil dihitung eksak,
+    setelah itu buffer dikompres menjadi paling banyak ~compression centroid.
+    """
+
+    def __init__(self, compression: float = 200, buffer_size: int = 50_000):
+        self.compression = compression
+        self.buffer_size = buffer_size
+        self.means = np.empty(0)
+        self.weights = np.empty(0)
+        self._buffer: List[np.ndarray] = []
+        self._buffered = 0
+        self.count = 0
+        self.min = np.inf
+        self.max = -np.inf
+
+    def add(self, values: np.ndarray) -> None:
+        if len(values) == 0:
+            return
+        self._buffer.append(values)
+        self._buffered += len(values)
+        self.count += len(values)
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+        if self._buffered > self.buffer_size:
+            self._compress()
+
+    @property
+    def is_exact(self) -> bool:
+        return len(self.weights) == 0
+
+    def _compress(self) -> None:
+        # Buffer diurutkan (np.sort, jauh lebih cepat dari argsort), centroid lama disisipkan
+        values = np.sort(np.concatenate(self._buffer)) if self._buffer else np.empty(0)
+        # Nilai kembar dilipat dulu (kolom rating/flag hanya punya beberapa nilai unik)
+        first = np.flatnonzero(np.concatenate([[True], values[1:] != values[:-1]])[:len(values)])
+        counts = np.diff(np.append(first, len(values))).astype(np.float64)
+        values = values[first]
+        position = np.searchsorted(values, self.means)
+        means = np.insert(values, position, self.means)
+        weights = np.insert(counts, position, self.weights)
+
+        # q kiri tiap titik -> k1(q); titik dengan floor(k) sama digabung ke satu centroid
+        total = weights.sum()
+        q_left = (np.cumsum(weights) - weights) / total
+        k = self.compression / (2 * np.pi) * np.arcsin(np.clip(2 * q_left - 1, -1, 1))
+        bucket = np.floor(k - k[0])
+        group = np.concatenate([[0], np.cumsum(bucket[1:] != bucket[:-1])])
+
+        new_weights = np.bincount(group, weights=weights)
+        self.means = np.bincount(group, weights=means * weights) / new_weights
+        self.weights = new_weights
+        self._buffer, self._buffered = [], 0
+
+    def quantiles(self, qs: List[float]) -> List[float]:
+        if self.count == 0:
+            return [np.nan] * len(qs)
+        if self.is_exact:
+            return list(np.quantile(np.concatenate(self._buffer), qs))
+        if self._buffer:
+            self._compress()
+        # Interpolasi linear antar pusat massa centroid, diapit min/max eksak
+        centers = np.cumsum(self.weights) - self.weights / 2
+        xs = np.concatenate([[0.0], centers, [self.count]])
+        ys = np.concatenate([[self.min], self.means, [self.max]])
+        return list(np.interp(np.asarray(qs) * self.count, xs, ys))
+
+class ColumnSketch:
+    """Statistik berjalan satu kolom: distinct (HLL), dan untuk kolom numerik momen + t-digest"""
+
+    def __init__(self, numeric: bool, hll_precision: int = 12):
+        self.numeric = numeric
+        self.hll = HyperLogLog(hll_precision)
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.digest = TDigest() if numeric else None
+
+    def update(self, series: pd.Series) -> None:
+        values = series.dropna()
+        self.hll.add_hashes(pd.util.hash_pandas_object(values, index=False).to_numpy())
+        if not self.numeric or len(values) == 0:
+            return
+
+        x = values.to_numpy(dtype=np.float64)
+        n_b = len(x)
+        mean_b = x.mean()
+        m2_b = float(((x - mean_b) ** 2).sum())
+        n = self.count + n_b
+        delta = mean_b - self.mean
+        self.mean += delta * n_b / n
+        self.m2 += m2_b + delta * delta * self.count * n_b / n
+        self.count = n
+        self.digest.add(x)
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else np.nan
+
+def _is_numeric(series: pd.Series) -> bool:
+    return pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series)
+
+class DatasetProfile:
+    """
+    Profil dataset yang dibangun dalam satu pass per chunk (update), dipakai ulang oleh
+    setiap render dashboard: ukuran hasil tidak bergantung pada jumlah baris.
+    """
+
+    def __init__(self, hll_precision: int = 12):
+        self.hll_precision = hll_precision
+        self.n_rows = 0
+        self.null_counts = pd.Series(dtype="int64")
+        self.dtypes = pd.Series(dtype=object)
+        self.columns: Dict[str, ColumnSketch] = {}
+        self._describe: Optional[pd.DataFrame] = None
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        self.n_rows += len(chunk)
+        self.null_counts = self.null_counts.add(chunk.isnull().sum(), fill_value=0).astype("int64")
+        for col in chunk.columns:
+            sketch = self.columns.get(col)
+            if sketch is None:
+                sketch = self.columns[col] = ColumnSketch(_is_numeric(chunk[col]), self.hll_precision)
+            sketch.update(chunk[col])
+        self._describe = None
+
+    def set_dtypes(self, dtypes: pd.Series) -> None:
+        """dtype final dataframe (setelah concat/kompaksi chunk)"""
+        self.dtypes = dtypes
+
+    @classmethod
+    def from_dataframe(cls, df: pd.DataFrame, chunksize: int = 200_000) -> "DatasetProfile":
+        profile = cls()
+        for start in range(0, max(len(df), 1), chunksize):
+            profile.update(df.iloc[start:start + chunksize])
+        profile.set_dtypes(df.dtypes)
+        return profile
+
+    # ------------------------------------------------------------------
+    # Ringkasan untuk dashboard
+    # ------------------------------------------------------------------
+    def _numeric(self) -> Dict[str, ColumnSketch]:
+        return {col: s for col, s in self.columns.items() if s.numeric}
+
+    @property
+    def means(self) -> pd.Series:
+        return pd.Series({col: s.mean if s.count else np.nan for col, s in self._numeric().items()}, dtype="float64")
+
+    @property
+    def mins(self) -> pd.Series:
+        return pd.Series({col: s.digest.min if s.count else np.nan for col, s in self._numeric().items()}, dtype="float64")
+
+    @property
+    def maxs(self) -> pd.Series:
+        return pd.Series({col: s.digest.max if s.count else np.nan for col, s in self._numeric().items()}, dtype="float64")
+
+    @property
+    def total_nulls(self) -> int:
+        return int(self.null_counts.sum())
+
+    @property
+    def dtype_counts(self) -> pd.Series:
+        return self.dtypes.astype(str).value_counts()
+
+    def distinct_counts(self) -> pd.Series:
+        """Perkiraan jumlah nilai unik per kolom (HyperLogLog)"""
+        return pd.Series({col: round(s.hll.estimate()) for col, s in self.columns.items()}, dtype="int64")
+
+    def describe(self) -> pd.DataFrame:
+        """Setara df.describe() untuk kolom numerik (kuantil eksak atau t-digest), di-memo"""
+        if self._describe is None:
+            rows = {}
+            for col, s in self._numeric().items():
+                quantiles = s.digest.quantiles(DESCRIBE_PERCENTILES)
+                rows[col] = [s.count, s.mean if s.count else np.nan, s.std,
+                             s.digest.min if s.count else np.nan, *quantiles,
+                             s.digest.max if s.count else np.nan]
+            index = ['count', 'mean', 'std', 'min'] + [f"{q:.0%}" for q in DESCRIBE_PERCENTILES] + ['max']
+            self._describe = pd.DataFrame(rows, index=index, dtype="float64")
+        return self._describe
+
+    @property
+    def quantiles_exact(self) -> bool:
+        return all(s.digest.is_exact for s in self._numeric().values())
+
+    def column_summary(self) -> pd.DataFrame:
+        """Satu baris per kolom: dtype, missing, distinct (perkiraan)"""
+        columns = list(self.columns)
+        nulls = self.null_counts.reindex(columns, fill_value=0)
+        return pd.DataFrame({
+            'Column': columns,
+            'Dtype': [str(self.dtypes.get(col, '')) for col in columns],
+            'Missing': nulls.values,
+            'Missing (%)': nulls.values / max(self.n_rows, 1) * 100,
+            'Distinct (≈)': self.distinct_counts().reindex(columns).values,
+        })
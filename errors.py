@@ -0,0 +1,27 @@
+from typing import Optional
+
+# ======================================================================
+# ERROR TERSTRUKTUR LIBRARY
+# ======================================================================
+# Modul inti (mapping, katalog, TOPSIS, scoring) tidak bergantung pada UI: kegagalan
+# dilaporkan sebagai exception di bawah ini, lalu ditampilkan oleh lapisan pemanggil
+# (streamlit_adapter untuk app, ringkasan status untuk batch runner).
+
+class DSSError(Exception):
+    """Base error sistem rekomendasi; message siap ditampilkan ke user"""
+
+    def __init__(self, message: str, detail: Optional[str] = None):
+        super().__init__(message)
+        self.message = message
+        self.detail = detail
+
+    def __str__(self) -> str:
+        return f"{self.message}: {self.detail}" if self.detail else self.message
+
+class ModelLoadError(DSSError):
+    """File model / feature names tidak bisa dimuat"""
+
+    def __init__(self, model_file: str, feature_names_file: str, detail: Optional[str] = None):
+        super().__init__("Error memuat model", detail)
+        self.model_file = model_file
+        self.feature_names_file = feature_names_file
@@ -0,0 +1,229 @@
+import warnings
+import numpy as np
+import pandas as pd
+from typing import Callable, Dict, List, Optional, Tuple
+
+from instrumentation import instrument
+
+# ======================================================================
+# REKAYASA FITUR (DIPAKAI BERSAMA OLEH NOTEBOOK DAN APP)
+# ======================================================================
+# Setiap fitur turunan dideklarasikan sekali: nama, input, dan fungsi vektor NumPy.
+# Formula mengikuti dss_model.ipynb (mis. SpendPerPerson = AverageSpend / (GroupSize + 1)).
+
+RATING_COLUMNS = ['ServiceRating', 'FoodRating', 'AmbianceRating']
+
+class DerivedFeature:
+    """
+    Deklarasi satu fitur turunan.
+    func menerima dict {nama input: array float64} dan mengembalikan array.
+    min_inputs: jumlah minimum input yang harus tersedia (None = semua input wajib).
+    threshold: untuk fitur flag berbasis statistik (kuantil/median), fungsi dict input -> ambang;
+    func lalu dipanggil sebagai func(input, ambang). Ambang diambil dari FeatureReference.
+    """
+
+    def __init__(self, name: str, inputs: List[str], func: Callable, min_inputs: Optional[int] = None,
+                 threshold: Optional[Callable] = None):
+        self.name = name
+        self.inputs = inputs
+        self.func = func
+        self.min_inputs = len(inputs) if min_inputs is None else min_inputs
+        self.threshold = threshold
+
+def _stack(cols: Dict[str, np.ndarray]) -> np.ndarray:
+    return np.column_stack([cols[c] for c in RATING_COLUMNS if c in cols])
+
+def _nan_reduce(func: Callable, cols: Dict[str, np.ndarray]) -> np.ndarray:
+    # Baris tanpa rating sama sekali menghasilkan NaN tanpa RuntimeWarning
+    with np.errstate(invalid='ignore'), warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        return func(_stack(cols), axis=1)
+
+def _flag(condition: np.ndarray) -> np.ndarray:
+    return condition.astype(np.float32)
+
+def _age_group(age: np.ndarray) -> np.ndarray:
+    # pd.cut(bins=[0, 25, 35, 45, 55, 100], labels=[0..4]), interval kanan tertutup
+    group = np.searchsorted([25, 35, 45, 55], age, side='left').astype(np.float64)
+    group[~((age > 0) & (age <= 100))] = np.nan
+    return group
+
+def _rating_std(cols: Dict[str, np.ndarray]) -> np.ndarray:
+    ratings = _stack(cols)
+    with np.errstate(invalid='ignore', divide='ignore'), warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        return np.nanstd(ratings, axis=1, ddof=1) if ratings.shape[1] > 1 else np.full(len(ratings), np.nan)
+
+DERIVED_FEATURES: Dict[str, DerivedFeature] = {f.name: f for f in [
+    # Rating-based features (minimal 2 dari 3 rating tersedia)
+    DerivedFeature('TotalRating', RATING_COLUMNS, lambda c: np.nansum(_stack(c), axis=1), min_inputs=2),
+    DerivedFeature('AvgRating', RATING_COLUMNS, lambda c: _nan_reduce(np.nanmean, c), min_inputs=2),
+    DerivedFeature('RatingStd', RATING_COLUMNS, _rating_std, min_inputs=2),
+    DerivedFeature('MaxRating', RATING_COLUMNS, lambda c: _nan_reduce(np.nanmax, c), min_inputs=2),
+    DerivedFeature('MinRating', RATING_COLUMNS, lambda c: _nan_reduce(np.nanmin, c), min_inputs=2),
+    DerivedFeature('RatingRange', ['MaxRating', 'MinRating'],
+                   lambda c: c['MaxRating'] - c['MinRating']),
+
+    # Spending features
+    DerivedFeature('SpendPerPerson', ['AverageSpend', 'GroupSize'],
+                   lambda c: c['AverageSpend'] / (c['GroupSize'] + 1)),
+    DerivedFeature('SpendToIncomeRatio', ['AverageSpend', 'Income'],
+                   lambda c: c['AverageSpend'] / (c['Income'] + 1)),
+    DerivedFeature('HighSpender', ['AverageSpend'], lambda c, t: _flag(c['AverageSpend'] > t),
+                   threshold=lambda c: np.nanquantile(c['AverageSpend'], 0.75)),
+
+    # Wait time features
+    DerivedFeature('LongWait', ['WaitTime'], lambda c, t: _flag(c['WaitTime'] > t),
+                   threshold=lambda c: np.nanquantile(c['WaitTime'], 0.75)),
+    DerivedFeature('WaitToService', ['WaitTime', 'ServiceRating'],
+                   lambda c: c['WaitTime'] / (c['ServiceRating'] + 1)),
+
+    # Customer profile features
+    DerivedFeature('HighIncome', ['Income'], lambda c, t: _flag(c['Income'] > t),
+                   threshold=lambda c: np.nanmedian(c['Income'])),
+    DerivedFeature('FrequentVisitor', ['VisitFrequency'], lambda c, t: _flag(c['VisitFrequency'] >= t),
+                   threshold=lambda c: np.nanmedian(c['VisitFrequency'])),
+    DerivedFeature('LoyalCustomer', ['LoyaltyProgramMember'], lambda c: c['LoyaltyProgramMember']),
+    DerivedFeature('OnlineUser', ['OnlineReservation'], lambda c: c['OnlineReservation']),
+
+    # Age-based features
+    DerivedFeature('AgeGroup', ['Age'], lambda c: _age_group(c['Age'])),
+    DerivedFeature('YoungCustomer', ['Age'], lambda c: _flag(c['Age'] < 30)),
+    DerivedFeature('SeniorCustomer', ['Age'], lambda c: _flag(c['Age'] > 55)),
+
+    # Interaction features
+    DerivedFeature('Rating_x_Loyalty', ['AvgRating', 'LoyaltyProgramMember'],
+                   lambda c: c['AvgRating'] * c['LoyaltyProgramMember']),
+    DerivedFeature('Rating_x_Frequency', ['AvgRating', 'VisitFrequency'],
+                   lambda c: c['AvgRating'] * c['VisitFrequency']),
+    DerivedFeature('Wait_x_Service', ['WaitTime', 'ServiceRating'],
+                   lambda c: c['WaitTime'] * (6 - c['ServiceRating'])),
+    DerivedFeature('Spend_x_Rating', ['AverageSpend', 'AvgRating'],
+                   lambda c: c['AverageSpend'] * c['AvgRating']),
+
+    # Group dynamics
+    DerivedFeature('LargeGroup', ['GroupSize'], lambda c: _flag(c['GroupSize'] > 3)),
+    DerivedFeature('Solo', ['GroupSize'], lambda c: _flag(c['GroupSize'] == 1)),
+
+    # Quality consistency indicator
+    DerivedFeature('ConsistentQuality', ['RatingStd'], lambda c: _flag(c['RatingStd'] < 0.5)),
+]}
+
+def _is_text(series: pd.Series) -> bool:
+    return not pd.api.types.is_numeric_dtype(series) or isinstance(series.dtype, pd.CategoricalDtype)
+
+def _categories(series: pd.Series) -> List[str]:
+    """Urutan label encoding kolom teks (nilai tersortir, seperti LabelEncoder)"""
+    return sorted(pd.unique(series.dropna().astype(str)))
+
+def _numeric_values(series: pd.Series, categories: Optional[List[str]] = None) -> np.ndarray:
+    """
+    Kolom input sebagai float64; kolom teks di-label-encode dengan categories
+    (None = kategori kolom itu sendiri). Nilai di luar categories menjadi NaN.
+    """
+    if not _is_text(series):
+        return series.to_numpy(dtype=np.float64, na_value=np.nan)
+    values = series.astype(str).where(series.notna())
+    codes = pd.Categorical(values, categories=_categories(series) if categories is None else categories).codes
+    return np.where(codes < 0, np.nan, codes).astype(np.float64)
+
+class FeatureReference:
+    """
+    Acuan fitur turunan dari dataset training: kategori label encoding per feature dasar
+    dan ambang fitur flag (HighSpender, LongWait, HighIncome, FrequentVisitor).
+    Dengan acuan tetap, fitur turunan satu baris tidak bergantung pada baris lain di upload.
+    """
+
+    def __init__(self, categories: Optional[Dict[str, List[str]]] = None,
+                 thresholds: Optional[Dict[str, float]] = None):
+        self.categories = dict(categories or {})
+        self.thresholds = dict(thresholds or {})
+
+    @classmethod
+    def fit(cls, df: pd.DataFrame, column_map: Optional[Dict[str, str]] = None) -> "FeatureReference":
+        """Fit dari dataset training; column_map: {feature dasar: kolom df} (default kolom df apa adanya)"""
+        column_map = dict(column_map) if column_map is not None else {c: c for c in df.columns}
+        column_map = {feat: col for feat, col in column_map.items() if col in df.columns}
+        reference = cls()
+        for feat, col in column_map.items():
+            if feat not in DERIVED_FEATURES and _is_text(df[col]):
+                reference.categories[feat] = _categories(df[col])
+        for spec in DERIVED_FEATURES.values():
+            if spec.threshold is None or not all(i in column_map for i in spec.inputs):
+                continue
+            inputs = {i: _numeric_values(df[column_map[i]], reference.categories.get(i)) for i in spec.inputs}
+            reference.thresholds[spec.name] = float(spec.threshold(inputs))
+        return reference
+
+def resolve_plan(available: List[str], targets: Optional[List[str]] = None) -> List[str]:
+    """
+    Urutan perhitungan fitur turunan (topological) untuk target yang bisa dihitung
+    dari kolom available. Dependency antar fitur turunan ikut dimasukkan satu kali.
+    """
+    available = set(available)
+    targets = list(DERIVED_FEATURES) if targets is None else [t for t in targets if t in DERIVED_FEATURES]
+    plan: List[str] = []
+    state: Dict[str, bool] = {}
+
+    def computable(name: str) -> bool:
+        if name in available:
+            return True
+        if name in state:
+            return state[name]
+        spec = DERIVED_FEATURES.get(name)
+        state[name] = False
+        if spec is None:
+            return False
+        n_ok = sum(computable(i) for i in spec.inputs)
+        state[name] = n_ok >= spec.min_inputs
+        if state[name]:
+            plan.append(name)
+        return state[name]
+
+    for target in targets:
+        computable(target)
+    return plan
+
+@instrument("feature_engineering")
+def engineer_features(df: pd.DataFrame,
+                      column_map: Optional[Dict[str, str]] = None,
+                      targets: Optional[List[str]] = None,
+                      reference: Optional[FeatureReference] = None) -> Tuple[pd.DataFrame, Dict[str, List[str]]]:
+    """
+    Hitung fitur turunan secara vektor.
+    - column_map: {nama feature dasar: nama kolom di df}; default = kolom df apa adanya
+    - targets: fitur turunan yang diminta (default semua yang bisa dihitung)
+    - reference: kategori dan ambang acuan (None = di-fit dari df itu sendiri, seperti notebook)
+    Hasil ditulis ke buffer float32 yang dialokasikan sekali; setiap fitur dihitung sekali.
+    Return: (dataframe fitur turunan, {fitur: input yang dipakai})
+    """
+    column_map = dict(column_map) if column_map is not None else {c: c for c in df.columns}
+    column_map = {feat: col for feat, col in column_map.items() if col in df.columns}
+    plan = resolve_plan(list(column_map), targets)
+    if reference is None:
+        reference = FeatureReference.fit(df, column_map)
+
+    # Buffer kolom-mayor agar setiap fitur ditulis ke memori yang berurutan
+    buffer = np.empty((len(df), len(plan)), dtype=np.float32, order='F')
+    values: Dict[str, np.ndarray] = {}
+    sources: Dict[str, List[str]] = {}
+
+    def get(name: str) -> Optional[np.ndarray]:
+        if name not in values and name in column_map:
+            values[name] = _numeric_values(df[column_map[name]], reference.categories.get(name))
+        return values.get(name)
+
+    for j, name in enumerate(plan):
+        spec = DERIVED_FEATURES[name]
+        inputs = {i: get(i) for i in spec.inputs if get(i) is not None}
+        if spec.threshold is None:
+            buffer[:, j] = spec.func(inputs)
+        else:
+            threshold = reference.thresholds.get(name)
+            buffer[:, j] = spec.func(inputs, spec.threshold(inputs) if threshold is None else threshold)
+        values[name] = buffer[:, j]
+        sources[name] = [column_map.get(i, i) for i in inputs]
+
+    wanted = plan if targets is None else [n for n in plan if n in set(targets)]
+    derived = pd.DataFrame({n: buffer[:, plan.index(n)] for n in wanted}, index=df.index)
+    return derived, {n: sources[n] for n in wanted}
@@ -0,0 +1,94 @@
+"""
+Cek budget waktu import (cold start worker Streamlit).
+
+Setiap modul aplikasi diimpor di interpreter baru, setelah streamlit/pandas/numpy
+(yang memang selalu dibutuhkan) dimuat. Dicek tiga hal:
+1. Waktu import tambahan modul tidak melebihi budget (ms)
+2. Dependency berat (fuzzy matching, xgboost/joblib, plotly, katalog strategi)
+   belum ikut termuat sebelum benar-benar dipakai
+3. Library inti (LIBRARY_MODULES) bisa diimpor tanpa ikut memuat streamlit
+
+Jalankan: python import_budget.py   (exit code 1 jika ada pelanggaran)
+"""
+import json
+import os
+import subprocess
+import sys
+
+# Budget waktu import per modul (ms), di luar streamlit/pandas/numpy
+MODULE_BUDGETS_MS = {
+    "app": 150,
+    "data_mapping": 50,
+    "data_loader": 50,
+    "topsis_utils": 20,
+    "scoring": 20,
+    "pipeline": 30,
+    "ui_components": 20,
+}
+
+# Library inti yang harus bisa diimpor worker/service tanpa stack UI
+LIBRARY_MODULES = [
+    "instrumentation",
+    "dataset_profile",
+    "dataset_preview",
+    "data_mapping",
+    "data_loader",
+    "topsis_utils",
+    "scoring",
+    "pipeline",
+    "batch_runner",
+    "service",
+]
+UI_MODULES = ["streamlit"]
+
+# Modul yang harus dimuat saat pertama kali dipakai, bukan saat import
+LAZY_MODULES = ["rapidfuzz", "fuzzywuzzy", "joblib", "xgboost", "plotly", "strategy_catalog"]
+
+BASE_IMPORTS = "import streamlit, pandas, numpy"
+
+_PROBE = """
+import json, sys, time
+{base}
+baseline = set(sys.modules)
+start = time.perf_counter()
+import {module}
+elapsed_ms = (time.perf_counter() - start) * 1000
+lazy = {lazy!r}
+print(json.dumps({{
+    "elapsed_ms": elapsed_ms,
+    "eager": [m for m in lazy if m in sys.modules and m not in baseline],
+}}))
+"""
+
+def measure(module: str, base: str = BASE_IMPORTS, lazy=None) -> dict:
+    """Ukur import satu modul di interpreter baru"""
+    code = _PROBE.format(base=base, module=module, lazy=LAZY_MODULES if lazy is None else lazy)
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True, text=True,
+        cwd=os.path.dirname(os.path.abspath(__file__))
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Import {module} gagal:\n{result.stderr}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+def main() -> int:
+    failures = 0
+    for module, budget_ms in MODULE_BUDGETS_MS.items():
+        stats = measure(module)
+        over_budget = stats["elapsed_ms"] > budget_ms
+        status = "FAIL" if over_budget or stats["eager"] else "OK"
+        print(f"{status:4} {module:15} {stats['elapsed_ms']:7.1f} ms (budget {budget_ms} ms)"
+              + (f"  eager: {', '.join(stats['eager'])}" if stats["eager"] else ""))
+        failures += status == "FAIL"
+
+    for module in LIBRARY_MODULES:
+        stats = measure(module, base="import pandas, numpy", lazy=UI_MODULES)
+        status = "FAIL" if stats["eager"] else "OK"
+        print(f"{status:4} {module:15} tanpa UI"
+              + (f"  eager: {', '.join(stats['eager'])}" if stats["eager"] else ""))
+        failures += status == "FAIL"
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,177 @@
+import contextvars
+import functools
+import itertools
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional
+
+# ======================================================================
+# INSTRUMENTASI PER STAGE (DURASI, BARIS, DELTA MEMORI)
+# ======================================================================
+# span() / @instrument() mencatat setiap stage ke:
+# 1. trace aktif (list per run/thread, dipakai panel Performance di sidebar)
+# 2. agregat per proses (untuk metrik teks Prometheus)
+# 3. logger "dss.perf" sebagai satu baris JSON per span
+
+logger = logging.getLogger("dss.perf")
+
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+_CURRENT_TRACE: contextvars.ContextVar = contextvars.ContextVar("dss_perf_trace", default=None)
+_CURRENT_SPAN: contextvars.ContextVar = contextvars.ContextVar("dss_perf_span", default=None)
+
+_TOTALS: Dict[str, Dict[str, float]] = {}
+_TOTALS_LOCK = threading.Lock()
+_SEQUENCE = itertools.count()
+
+def current_rss_bytes() -> Optional[int]:
+    """RSS proses saat ini (Linux /proc/self/statm); None jika tidak tersedia"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        return None
+
+class Span:
+    """Satu pengukuran stage; rows bisa diisi di dalam blok with"""
+
+    __slots__ = ("name", "parent", "depth", "rows", "duration", "memory_delta", "started_at", "seq")
+
+    def __init__(self, name: str, parent: Optional["Span"], rows: Optional[int]):
+        self.name = name
+        self.parent = parent
+        self.depth = parent.depth + 1 if parent is not None else 0
+        self.rows = rows
+        self.duration = 0.0
+        self.memory_delta: Optional[int] = None
+        self.started_at = time.time()
+        self.seq = next(_SEQUENCE)
+
+    def as_dict(self) -> Dict:
+        return {
+            'stage': self.name,
+            'parent': self.parent.name if self.parent is not None else None,
+            'depth': self.depth,
+            'duration_ms': self.duration * 1000,
+            'rows': self.rows,
+            'memory_delta_bytes': self.memory_delta,
+        }
+
+def _record(span: Span) -> None:
+    trace = _CURRENT_TRACE.get()
+    if trace is not None:
+        trace.append(span)
+
+    with _TOTALS_LOCK:
+        totals = _TOTALS.setdefault(span.name, {'count': 0, 'seconds': 0.0, 'rows': 0, 'memory_delta_bytes': 0})
+        totals['count'] += 1
+        totals['seconds'] += span.duration
+        totals['rows'] += span.rows or 0
+        totals['memory_delta_bytes'] += span.memory_delta or 0
+
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(json.dumps({'event': 'span', **span.as_dict()}))
+
+@contextmanager
+def span(name: str, rows: Optional[int] = None):
+    """
+    Ukur satu blok kode:
+        with span("csv_parse") as s:
+            df = ...
+            s.rows = len(df)
+    """
+    parent = _CURRENT_SPAN.get()
+    current = Span(name, parent, rows)
+    token = _CURRENT_SPAN.set(current)
+    rss_before = current_rss_bytes()
+    start = time.perf_counter()
+    try:
+        yield current
+    finally:
+        current.duration = time.perf_counter() - start
+        rss_after = current_rss_bytes()
+        if rss_before is not None and rss_after is not None:
+            current.memory_delta = rss_after - rss_before
+        _CURRENT_SPAN.reset(token)
+        _record(current)
+
+def _infer_rows(args, result) -> Optional[int]:
+    for value in (*args, result):
+        if hasattr(value, "shape") and len(getattr(value, "shape", ())) >= 1:
+            return int(value.shape[0])
+    return None
+
+def instrument(name: Optional[str] = None, rows: Optional[Callable] = None):
+    """
+    Decorator span untuk sebuah fungsi. Jumlah baris diambil dari rows(args, result) jika
+    diberikan, atau dari argumen/hasil pertama yang punya .shape (DataFrame/array).
+    """
+    def decorator(func: Callable) -> Callable:
+        stage = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(stage) as s:
+                result = func(*args, **kwargs)
+                s.rows = rows(args, result) if rows is not None else _infer_rows(args, result)
+                return result
+        return wrapper
+    return decorator
+
+@contextmanager
+def trace():
+    """
+    Kumpulkan semua span di dalam blok ini (mis. satu run script Streamlit):
+        with trace() as spans:
+            ...
+    """
+    spans: List[Span] = []
+    token = _CURRENT_TRACE.set(spans)
+    try:
+        yield spans
+    finally:
+        _CURRENT_TRACE.reset(token)
+
+def start_trace() -> List[Span]:
+    """Mulai trace untuk sisa konteks saat ini (tanpa blok with), return list span-nya"""
+    spans: List[Span] = []
+    _CURRENT_TRACE.set(spans)
+    return spans
+
+def trace_records(spans: List[Span]) -> List[Dict]:
+    """Span dalam urutan mulai (parent sebelum child-nya), siap ditampilkan sebagai pohon"""
+    return [s.as_dict() for s in sorted(spans, key=lambda s: s.seq)]
+
+def totals() -> Dict[str, Dict[str, float]]:
+    """Agregat per stage sejak proses dimulai"""
+    with _TOTALS_LOCK:
+        return {name: dict(values) for name, values in _TOTALS.items()}
+
+def reset_totals() -> None:
+    with _TOTALS_LOCK:
+        _TOTALS.clear()
+
+def prometheus_text(prefix: str = "dss_stage") -> str:
+    """Agregat per stage dalam format teks eksposisi Prometheus"""
+    metrics = [
+        ('duration_seconds', 'summary', 'Durasi stage (detik)', 'seconds'),
+        ('rows_total', 'counter', 'Jumlah baris yang diproses stage', 'rows'),
+        ('memory_delta_bytes', 'gauge', 'Akumulasi delta RSS stage (byte, bisa negatif)', 'memory_delta_bytes'),
+    ]
+    snapshot = totals()
+    lines = []
+    for suffix, kind, help_text, key in metrics:
+        metric = f"{prefix}_{suffix}"
+        lines.append(f"# HELP {metric} {help_text}")
+        lines.append(f"# TYPE {metric} {kind}")
+        for stage, values in sorted(snapshot.items()):
+            label = stage.replace("\\", "\\\\").replace('"', '\\"')
+            if kind == 'summary':
+                lines.append(f'{metric}_count{{stage="{label}"}} {int(values["count"])}')
+                lines.append(f'{metric}_sum{{stage="{label}"}} {values[key]:.6f}')
+            else:
+                lines.append(f'{metric}{{stage="{label}"}} {int(values[key])}')
+    return "\n".join(lines) + "\n"
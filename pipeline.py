@@ -0,0 +1,254 @@
+import hashlib
+import os
+import pickle
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from data_loader import read_customer_data, read_dataset_header
+from data_mapping import (
+    build_segment_topsis_tensor,
+    build_topsis_matrix,
+    get_strategy_catalog,
+    map_dataset_to_features,
+    source_columns_for_mapping,
+)
+from instrumentation import span
+from scoring import global_feature_importance, score_customers, segment_shap_importance, shap_feature_importance
+from topsis_utils import PreparedTopsis, calculate_segment_topsis, calculate_topsis, prepare_topsis, topsis_sensitivity
+
+# ======================================================================
+# PIPELINE INKREMENTAL (DAG + CACHE PER STEP)
+# ======================================================================
+# Setiap step hanya dijalankan ulang jika key salah satu inputnya berubah.
+# Key input = fingerprint nilainya (atau key eksplisit, mis. file_id upload);
+# key step = hash(nama step, parameter, key semua input).
+
+def fingerprint(value) -> str:
+    """Hash isi sebuah nilai input (dataframe/array di-hash per nilai, objek lain via pickle)"""
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        columns = list(value.columns) if isinstance(value, pd.DataFrame) else [value.name]
+        payload = pd.util.hash_pandas_object(value, index=True).values.tobytes() + repr(columns).encode()
+    elif isinstance(value, np.ndarray):
+        payload = value.tobytes() + repr((value.shape, str(value.dtype))).encode()
+    else:
+        payload = pickle.dumps(value, protocol=4)
+    return hashlib.sha1(payload).hexdigest()
+
+class Pipeline:
+    """
+    DAG step dengan cache hasil per step. Step didaftarkan dengan add_step, nilai input
+    dengan set_input, lalu run(step) menghitung step beserta dependency yang key-nya berubah.
+    Setiap step menyimpan max_entries hasil terakhir (LRU), sehingga bolak-balik antar
+    pilihan (mis. sumber importance) juga tidak menghitung ulang. Step dengan hasil besar
+    (dataset penuh) bisa memakai batas sendiri lewat add_step(..., max_entries=1).
+    """
+
+    def __init__(self, max_entries: int = 4):
+        self.max_entries = max_entries
+        self._steps: Dict[str, Tuple[Callable, List[str], Dict]] = {}
+        self._inputs: Dict[str, Tuple[str, object]] = {}
+        self._cache: Dict[str, "OrderedDict[str, object]"] = {}
+        self._max_entries: Dict[str, int] = {}
+        self.stats: Dict[str, Dict] = {}
+
+    def add_step(self, name: str, func: Callable, inputs: Optional[List[str]] = None,
+                 max_entries: Optional[int] = None, **params) -> "Pipeline":
+        """Daftarkan step: func(*nilai inputs, **params); max_entries = batas cache step ini"""
+        self._steps[name] = (func, list(inputs or []), params)
+        self._max_entries[name] = self.max_entries if max_entries is None else max_entries
+        self._cache.setdefault(name, OrderedDict())
+        self.stats.setdefault(name, {'runs': 0, 'hits': 0, 'last_seconds': 0.0})
+        return self
+
+    def set_input(self, name: str, value, key: Optional[str] = None) -> bool:
+        """
+        Set nilai input. key eksplisit dipakai untuk nilai besar yang identitasnya sudah
+        diketahui (mis. file_id upload) agar tidak perlu di-hash setiap rerun.
+        Return True jika key input berubah.
+        """
+        key = str(key) if key is not None else fingerprint(value)
+        changed = name not in self._inputs or self._inputs[name][0] != key
+        self._inputs[name] = (key, value)
+        return changed
+
+    def key(self, name: str) -> str:
+        """Key input atau step (step: hash dari nama, parameter dan key dependency)"""
+        if name in self._inputs:
+            return self._inputs[name][0]
+        if name not in self._steps:
+            raise KeyError(f"Input/step pipeline tidak dikenal: {name}")
+        _, inputs, params = self._steps[name]
+        payload = repr((name, sorted(params.items()), [self.key(i) for i in inputs]))
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+    def run(self, name: str):
+        """Hasil step (atau nilai input); dihitung ulang hanya jika key berubah"""
+        if name in self._inputs:
+            return self._inputs[name][1]
+        func, inputs, params = self._steps[name]
+        key = self.key(name)
+        cache = self._cache[name]
+        with span(f"step:{name}") as s:
+            if key in cache:
+                s.name += " (cache)"
+                cache.move_to_end(key)
+                self.stats[name]['hits'] += 1
+                return cache[key]
+
+            values = [self.run(i) for i in inputs]
+            start = time.perf_counter()
+            result = func(*values, **params)
+            self.stats[name]['runs'] += 1
+            self.stats[name]['last_seconds'] = time.perf_counter() - start
+
+            cache[key] = result
+            while len(cache) > self._max_entries[name]:
+                cache.popitem(last=False)
+            return result
+
+    def invalidate(self, name: Optional[str] = None) -> None:
+        """Buang cache satu step (atau semua step)"""
+        for step in ([name] if name else list(self._cache)):
+            self._cache[step].clear()
+
+# ======================================================================
+# STEP ANALISIS (DIPAKAI APP DAN BATCH RUNNER)
+# ======================================================================
+def uses_column_projection(upload, large_file_bytes: Optional[int]) -> bool:
+    """Apakah load_dataset hanya membaca kolom mapping (file di atas large_file_bytes)"""
+    size = os.path.getsize(upload) if isinstance(upload, str) else getattr(upload, "size", None)
+    return large_file_bytes is not None and size is not None and size > large_file_bytes
+
+def load_dataset(upload, feature_names: Optional[List[str]], source: Optional[str],
+                 large_file_bytes: Optional[int] = None) -> Dict:
+    """
+    Baca dataset pelanggan CSV / Parquet / Arrow (dtype dikompaksi). File di atas
+    large_file_bytes hanya membaca kolom yang dipakai mapping (source menentukan sinonim).
+    """
+    usecols = None
+    if feature_names is not None and uses_column_projection(upload, large_file_bytes):
+        usecols = source_columns_for_mapping(read_dataset_header(upload), feature_names, source)
+    df, aggregates = read_customer_data(upload, usecols=usecols, optimize=True)
+    return {'df': df, 'aggregates': aggregates, 'usecols': usecols}
+
+def map_features(dataset: Dict, feature_names: List[str], source: Optional[str],
+                 synonym_revision: str = "", min_features: int = 5) -> Dict:
+    """Mapping kolom -> feature model (synonym_revision hanya dipakai sebagai bagian key cache)"""
+    is_valid, message, matched_features, num_matched, mapping_detail, df_final = map_dataset_to_features(
+        dataset['df'], feature_names, min_features, source=source
+    )
+    return {
+        'is_valid': is_valid,
+        'message': message,
+        'matched_features': matched_features,
+        'num_matched': num_matched,
+        'mapping_detail': mapping_detail,
+        'df_final': df_final,
+    }
+
+def compute_importance(model, mapping: Dict, feature_names: List[str], importance_source: str,
+                       preprocessor=None) -> pd.Series:
+    """
+    Importance feature yang ter-map, dinormalisasi (jumlah = 1).
+    preprocessor: preprocessor acuan untuk SHAP (default: dari dataset training bawaan)
+    """
+    if importance_source == "shap":
+        importances = shap_feature_importance(model, mapping['df_final'], mapping['mapping_detail'], feature_names,
+                                              preprocessor=preprocessor)
+    else:
+        importances = global_feature_importance(model, feature_names)
+    matched = importances[[mf for mf in mapping['mapping_detail'] if mf in feature_names]]
+    return matched / matched.sum()
+
+def build_decision_matrix(importances: pd.Series) -> Tuple[Optional[pd.DataFrame], List[float], List[str]]:
+    return build_topsis_matrix(list(importances.index), importances.to_dict(), get_strategy_catalog())
+
+def rank_strategies(topsis_matrix: Tuple) -> Optional[pd.DataFrame]:
+    decision_matrix, weights, criteria_types = topsis_matrix
+    if decision_matrix is None:
+        return None
+    return calculate_topsis(decision_matrix, weights, criteria_types)
+
+def prepare_decision_matrix(topsis_matrix: Tuple) -> Optional[PreparedTopsis]:
+    """R, mask dan jarak ideal yang tidak bergantung bobot (untuk ranking ulang interaktif)"""
+    decision_matrix, _, criteria_types = topsis_matrix
+    if decision_matrix is None:
+        return None
+    return prepare_topsis(decision_matrix, criteria_types)
+
+def score_dataset(model, mapping: Dict, feature_names: List[str]) -> pd.Series:
+    return score_customers(model, mapping['df_final'], mapping['mapping_detail'], feature_names)
+
+def run_sensitivity(topsis_matrix: Tuple, params: Dict) -> Dict[str, pd.DataFrame]:
+    decision_matrix, weights, criteria_types = topsis_matrix
+    return topsis_sensitivity(decision_matrix, weights, criteria_types, **params)
+
+def segment_labels(df: pd.DataFrame, segment_by: List[str]) -> pd.Series:
+    """Label segmen per baris ('nilai1 / nilai2'), categorical; baris dengan nilai kosong = NaN"""
+    grouped = df.groupby(list(segment_by), observed=True, sort=True, dropna=True)
+    codes = grouped.ngroup().reindex(df.index).fillna(-1).astype(np.int64).to_numpy()
+    names = [" / ".join(map(str, key if isinstance(key, tuple) else (key,))) for key in grouped.size().index]
+    return pd.Series(pd.Categorical.from_codes(codes, categories=names), index=df.index, name="Segment")
+
+def rank_segments(model, mapping: Dict, feature_names: List[str], dataset: Dict,
+                  segment_by: Tuple[str, ...], min_segment_size: int = 30, max_segments: int = 50) -> Dict:
+    """
+    TOPSIS per segmen: importance SHAP per segmen, lalu semua segmen di-ranking dalam satu
+    operasi tensor (segmen × strategi × feature). Segmen terbesar didahulukan; segmen di bawah
+    min_segment_size baris dilewati.
+    """
+    labels = segment_labels(dataset['df'], list(segment_by))
+    all_sizes = labels.value_counts()
+    all_sizes = all_sizes[all_sizes > 0]
+    sizes = all_sizes[all_sizes >= min_segment_size].head(max_segments)
+    result = {'sizes': sizes, 'skipped': len(all_sizes) - len(sizes), 'importances': None, 'rankings': None}
+    if sizes.empty:
+        return result
+
+    labels = labels.where(labels.isin(sizes.index))
+    importances = segment_shap_importance(model, mapping['df_final'], mapping['mapping_detail'],
+                                          feature_names, labels)
+    matched = [mf for mf in mapping['mapping_detail'] if mf in feature_names]
+    importances = importances.loc[list(sizes.index), matched]
+    importances = importances.div(importances.sum(axis=1), axis=0)
+
+    tensor, weights, criteria_types, strategies = build_segment_topsis_tensor(importances, get_strategy_catalog())
+    result['importances'] = importances
+    if tensor is not None:
+        result['rankings'] = calculate_segment_topsis(tensor, weights, criteria_types,
+                                                      list(importances.index), strategies)
+    return result
+
+def build_analysis_pipeline(large_file_bytes: Optional[int] = None, min_features: int = 5) -> Pipeline:
+    """
+    DAG analisis:
+    upload -> dataset -> mapping -> importance -> topsis_matrix -> topsis
+                                 \\-> scoring          \\-> sensitivity
+                                                      \\-> prepared_topsis
+                                 \\-> segment_topsis
+    Input: upload, model, feature_names, source, projection_source, synonym_revision,
+    importance_source ('shap' / 'global'), sensitivity_params, segment_by (tuple kolom).
+    projection_source = source jika uses_column_projection(upload) aktif, selain itu None,
+    sehingga mengganti source tidak mem-parse ulang upload yang dibaca penuh.
+    Step dataset dan mapping (dataframe penuh) hanya menyimpan 1 hasil per sesi.
+    """
+    pipeline = Pipeline()
+    pipeline.add_step("dataset", load_dataset, ["upload", "feature_names", "projection_source"],
+                      max_entries=1, large_file_bytes=large_file_bytes)
+    pipeline.add_step("mapping", map_features,
+                      ["dataset", "feature_names", "source", "synonym_revision"],
+                      max_entries=1, min_features=min_features)
+    pipeline.add_step("importance", compute_importance,
+                      ["model", "mapping", "feature_names", "importance_source"])
+    pipeline.add_step("topsis_matrix", build_decision_matrix, ["importance"])
+    pipeline.add_step("topsis", rank_strategies, ["topsis_matrix"])
+    pipeline.add_step("prepared_topsis", prepare_decision_matrix, ["topsis_matrix"])
+    pipeline.add_step("scoring", score_dataset, ["model", "mapping", "feature_names"])
+    pipeline.add_step("sensitivity", run_sensitivity, ["topsis_matrix", "sensitivity_params"])
+    pipeline.add_step("segment_topsis", rank_segments,
+                      ["model", "mapping", "feature_names", "dataset", "segment_by"])
+    return pipeline
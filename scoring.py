@@ -0,0 +1,322 @@
+import os
+import threading
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional, Tuple
+
+from instrumentation import instrument
+
+# ======================================================================
+# PREPROCESSING (REPRODUKSI NOTEBOOK dss_model.ipynb)
+# ======================================================================
+# Kolom yang di-clip (IQR 1.5) dan di-standardisasi di notebook
+NOTEBOOK_NUMERIC_COLUMNS = ['Age', 'Income', 'AverageSpend', 'WaitTime', 'ServiceRating',
+                            'FoodRating', 'AmbianceRating', 'TotalRating', 'AvgRating',
+                            'RatingStd', 'MaxRating', 'MinRating', 'RatingRange',
+                            'SpendPerPerson', 'SpendToIncomeRatio', 'WaitToService',
+                            'Rating_x_Loyalty', 'Rating_x_Frequency', 'Wait_x_Service',
+                            'Spend_x_Rating']
+
+DEFAULT_CHUNK_SIZE = 250_000
+
+def build_model_frame(df_final: pd.DataFrame,
+                      mapping_detail: Dict[str, str],
+                      feature_names: List[str]) -> pd.DataFrame:
+    """
+    Susun dataframe dengan kolom = feature model (urutan training).
+    Feature yang tidak ter-map diisi NaN (dianggap missing oleh XGBoost).
+    """
+    columns = {}
+    for feat in feature_names:
+        col = mapping_detail.get(feat)
+        if col is not None and col in df_final.columns:
+            columns[feat] = df_final[col]
+        else:
+            columns[feat] = pd.Series(np.nan, index=df_final.index, dtype="float32")
+    return pd.DataFrame(columns, index=df_final.index)
+
+class SatisfactionPreprocessor:
+    """
+    Preprocessing seperti di notebook: isi missing (modus/median), label encoding kolom
+    kategorikal, clipping IQR 1.5 dan StandardScaler pada NOTEBOOK_NUMERIC_COLUMNS.
+    Scaler/batas clipping training tidak ikut disimpan bersama model, jadi statistik
+    di-fit ulang pada dataset training acuan (lihat get_reference_preprocessor).
+    """
+
+    def __init__(self, numeric_columns: Optional[List[str]] = None):
+        self.numeric_columns = NOTEBOOK_NUMERIC_COLUMNS if numeric_columns is None else numeric_columns
+        self.categorical_ = {}
+        self.fill_values_ = {}
+        self.bounds_ = {}
+        self.means_ = {}
+        self.scales_ = {}
+
+    def _encode(self, X: pd.DataFrame) -> pd.DataFrame:
+        encoded = {}
+        for col, categories in self.categorical_.items():
+            values = X[col].astype(str).where(X[col].notna())
+            codes = pd.Categorical(values, categories=categories).codes
+            encoded[col] = np.where(codes < 0, np.nan, codes).astype("float32")
+        if encoded:
+            X = X.assign(**encoded)
+        return X.apply(pd.to_numeric, errors="coerce")
+
+    def fit(self, X: pd.DataFrame) -> "SatisfactionPreprocessor":
+        for col in X.columns:
+            s = X[col]
+            if not pd.api.types.is_numeric_dtype(s) or isinstance(s.dtype, pd.CategoricalDtype):
+                self.categorical_[col] = sorted(pd.unique(s.dropna().astype(str)))
+
+        encoded = self._encode(X)
+        for col in encoded.columns:
+            s = encoded[col]
+            if s.notna().any():
+                self.fill_values_[col] = (s.mode().iloc[0] if col in self.categorical_ else s.median())
+
+        encoded = encoded.fillna(self.fill_values_)
+        for col in self.numeric_columns:
+            if col not in encoded.columns or encoded[col].isna().all():
+                continue
+            q1, q3 = encoded[col].quantile([0.25, 0.75])
+            iqr = q3 - q1
+            lower, upper = q1 - 1.5 * iqr, q3 + 1.5 * iqr
+            clipped = encoded[col].clip(lower, upper)
+            std = clipped.std(ddof=0)
+            self.bounds_[col] = (lower, upper)
+            self.means_[col] = clipped.mean()
+            self.scales_[col] = std if std > 0 else 1.0
+        return self
+
+    def _as_array(self, X: pd.DataFrame) -> np.ndarray:
+        """Encode + konversi numerik langsung ke array float64 kolom-mayor"""
+        A = np.empty((len(X), X.shape[1]), dtype=np.float64, order='F')
+        for j, col in enumerate(X.columns):
+            s = X[col]
+            if col in self.categorical_:
+                values = s.astype(str).where(s.notna())
+                codes = pd.Categorical(values, categories=self.categorical_[col]).codes
+                A[:, j] = np.where(codes < 0, np.nan, codes)
+            else:
+                A[:, j] = pd.to_numeric(s, errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+        return A
+
+    def transform(self, X: pd.DataFrame) -> np.ndarray:
+        """Isi missing, clip dan scaling dalam operasi NumPy per kolom (tanpa overhead pandas)"""
+        A = self._as_array(X)
+        for j, col in enumerate(X.columns):
+            fill = self.fill_values_.get(col)
+            if fill is not None:
+                column = A[:, j]
+                column[np.isnan(column)] = fill
+            if col in self.bounds_:
+                lower, upper = self.bounds_[col]
+                A[:, j] = (np.clip(A[:, j], lower, upper) - self.means_[col]) / self.scales_[col]
+        return A.astype(np.float32)
+
+# Preprocessor acuan per proses: {(path dataset acuan, feature names): preprocessor}
+_REFERENCE_PREPROCESSORS: Dict[Tuple[str, tuple], SatisfactionPreprocessor] = {}
+_REFERENCE_PREPROCESSORS_LOCK = threading.Lock()
+
+def get_reference_preprocessor(feature_names: List[str],
+                               reference_file: Optional[str] = None) -> SatisfactionPreprocessor:
+    """
+    Preprocessor yang di-fit sekali per proses pada dataset training acuan
+    (default data_mapping.REFERENCE_FILE), sehingga encoding, nilai pengisi, batas IQR
+    dan scaler sama untuk setiap upload. Gagal membaca dataset acuan -> DSSError.
+    """
+    from data_mapping import REFERENCE_FILE, get_feature_reference, load_reference_dataset, map_dataset_to_features
+
+    reference_file = reference_file or REFERENCE_FILE
+    key = (os.path.abspath(reference_file), tuple(feature_names))
+    with _REFERENCE_PREPROCESSORS_LOCK:
+        if key not in _REFERENCE_PREPROCESSORS:
+            reference = load_reference_dataset(reference_file)
+            _, _, _, _, mapping_detail, df_final = map_dataset_to_features(
+                reference, feature_names, 1, reference=get_feature_reference(feature_names, reference_file)
+            )
+            X = build_model_frame(df_final, mapping_detail, feature_names)
+            _REFERENCE_PREPROCESSORS[key] = SatisfactionPreprocessor().fit(X)
+        return _REFERENCE_PREPROCESSORS[key]
+
+# ======================================================================
+# BATCH SCORING
+# ======================================================================
+def _booster(model):
+    return model.get_booster() if hasattr(model, "get_booster") else model
+
+def _iteration_range(model) -> tuple:
+    best_iteration = getattr(model, "best_iteration", None)
+    return (0, best_iteration + 1) if best_iteration is not None else (0, 0)
+
+def set_model_threads(model, n_threads: Optional[int]) -> None:
+    """
+    Jumlah thread XGBoost untuk prediksi. Booster dipakai bersama (registry model),
+    jadi cukup diatur sekali saat setup proses (worker batch / startup service).
+    """
+    if n_threads is not None:
+        _booster(model).set_param({"nthread": n_threads})
+
+def predict_satisfaction(model,
+                         X: np.ndarray,
+                         chunk_size: int = DEFAULT_CHUNK_SIZE) -> np.ndarray:
+    """
+    Probabilitas HighSatisfaction per baris dengan Booster.inplace_predict per chunk
+    (tanpa membangun DMatrix). Jumlah thread: set_model_threads.
+    """
+    booster = _booster(model)
+    iteration_range = _iteration_range(model)
+
+    proba = np.empty(len(X), dtype=np.float32)
+    for start in range(0, len(X), chunk_size):
+        chunk = X[start:start + chunk_size]
+        pred = booster.inplace_predict(chunk, iteration_range=iteration_range, missing=np.nan)
+        # Objective multi-output mengembalikan (n, 2): ambil kolom kelas positif
+        proba[start:start + len(chunk)] = pred[:, -1] if pred.ndim == 2 else pred
+    return proba
+
+@instrument("score_customers")
+def score_customers(model,
+                    df_final: pd.DataFrame,
+                    mapping_detail: Dict[str, str],
+                    feature_names: List[str],
+                    chunk_size: int = DEFAULT_CHUNK_SIZE,
+                    preprocessor: Optional[SatisfactionPreprocessor] = None) -> pd.Series:
+    """
+    Skor kepuasan per pelanggan dari output map_dataset_to_features.
+    Transform + prediksi dilakukan per chunk dengan preprocessor acuan (default
+    get_reference_preprocessor), sehingga skor satu pelanggan tidak bergantung pada baris lain.
+    """
+    X = build_model_frame(df_final, mapping_detail, feature_names)
+    preprocessor = preprocessor or get_reference_preprocessor(feature_names)
+
+    proba = np.empty(len(X), dtype=np.float32)
+    for start in range(0, len(X), chunk_size):
+        chunk = preprocessor.transform(X.iloc[start:start + chunk_size])
+        proba[start:start + len(chunk)] = predict_satisfaction(model, chunk, chunk_size)
+    return pd.Series(proba, index=df_final.index, name="HighSatisfaction_Proba")
+
+def segment_satisfaction(df: pd.DataFrame,
+                         proba: pd.Series,
+                         by: List[str],
+                         threshold: float = 0.5) -> pd.DataFrame:
+    """
+    Agregasi skor per segmen: jumlah pelanggan, rata-rata probabilitas,
+    dan persentase pelanggan yang diprediksi puas (proba >= threshold)
+    """
+    frame = df[by].copy()
+    frame["_proba"] = proba.values
+    frame["_satisfied"] = (proba.values >= threshold)
+    grouped = frame.groupby(by, observed=True, dropna=False)
+    result = pd.DataFrame({
+        'Customers': grouped.size(),
+        'Mean_Probability': grouped["_proba"].mean(),
+        'Satisfaction_Rate': grouped["_satisfied"].mean()
+    })
+    return result.sort_values('Satisfaction_Rate', ascending=False)
+
+# ======================================================================
+# FEATURE IMPORTANCE
+# ======================================================================
+SHAP_SAMPLE_SIZE = 2000
+SHAP_CHUNK_SIZE = 10_000
+# Total sampel SHAP untuk semua segmen, dibagi rata per segmen (minimal
+# SEGMENT_MIN_SAMPLE baris; segmen kecil memakai semua barisnya)
+SEGMENT_SHAP_SAMPLE_SIZE = 4000
+SEGMENT_MIN_SAMPLE = 100
+
+def global_feature_importance(model, feature_names: List[str]) -> pd.Series:
+    """Importance statis hasil training (model.feature_importances_)"""
+    return pd.Series(model.feature_importances_, index=feature_names)
+
+def shap_contributions(model,
+                       X: np.ndarray,
+                       feature_names: List[str],
+                       chunk_size: int = SHAP_CHUNK_SIZE,
+                       n_threads: Optional[int] = None,
+                       approximate: bool = False) -> np.ndarray:
+    """
+    Kontribusi TreeSHAP per baris (pred_contribs) dihitung per chunk.
+    n_threads hanya untuk membangun DMatrix per chunk; thread prediksi: set_model_threads.
+    Return: array (n_rows, n_features) tanpa kolom bias.
+    """
+    import xgboost as xgb
+
+    booster = _booster(model)
+    iteration_range = _iteration_range(model)
+    names = booster.feature_names or list(feature_names)
+
+    contribs = np.empty((len(X), len(names)), dtype=np.float32)
+    for start in range(0, len(X), chunk_size):
+        chunk = xgb.DMatrix(X[start:start + chunk_size], missing=np.nan, feature_names=names,
+                            nthread=n_threads)
+        pred = booster.predict(chunk, pred_contribs=True, approx_contribs=approximate,
+                               iteration_range=iteration_range)
+        contribs[start:start + pred.shape[0]] = pred[:, :-1]
+    return contribs
+
+@instrument("shap_feature_importance")
+def shap_feature_importance(model,
+                            df_final: pd.DataFrame,
+                            mapping_detail: Dict[str, str],
+                            feature_names: List[str],
+                            sample_size: Optional[int] = SHAP_SAMPLE_SIZE,
+                            chunk_size: int = SHAP_CHUNK_SIZE,
+                            n_threads: Optional[int] = None,
+                            approximate: bool = False,
+                            seed: int = 42,
+                            preprocessor: Optional[SatisfactionPreprocessor] = None) -> pd.Series:
+    """
+    Importance spesifik dataset: rata-rata |kontribusi SHAP| per feature atas baris yang
+    di-upload. Untuk dataset besar dipakai sampel acak sample_size baris (None = semua baris),
+    sehingga waktu komputasi tidak bergantung pada jumlah baris.
+    Input di-transform dengan preprocessor acuan yang sama seperti score_customers.
+    """
+    X = build_model_frame(df_final, mapping_detail, feature_names)
+    preprocessor = preprocessor or get_reference_preprocessor(feature_names)
+    if sample_size and len(X) > sample_size:
+        X = X.sample(sample_size, random_state=seed)
+
+    contribs = shap_contributions(model, preprocessor.transform(X), feature_names,
+                                  chunk_size=chunk_size, n_threads=n_threads,
+                                  approximate=approximate)
+    return pd.Series(np.abs(contribs).mean(axis=0), index=feature_names)
+
+@instrument("segment_shap_importance")
+def segment_shap_importance(model,
+                            df_final: pd.DataFrame,
+                            mapping_detail: Dict[str, str],
+                            feature_names: List[str],
+                            segments: pd.Series,
+                            sample_size: Optional[int] = SEGMENT_SHAP_SAMPLE_SIZE,
+                            chunk_size: int = SHAP_CHUNK_SIZE,
+                            n_threads: Optional[int] = None,
+                            seed: int = 42,
+                            preprocessor: Optional[SatisfactionPreprocessor] = None) -> pd.DataFrame:
+    """
+    Importance SHAP per segmen: kontribusi per baris dihitung sekali untuk sampel
+    gabungan (sample_size dibagi rata per segmen, None = semua baris), lalu rata-rata
+    |kontribusi| dikelompokkan per segmen. Waktu komputasi tidak naik dengan jumlah segmen.
+    segments: label segmen per baris (sejajar df_final, NaN = diabaikan).
+    Return: dataframe segmen × feature (urutan segmen = urutan kemunculan).
+    """
+    codes, labels = pd.factorize(segments.reindex(df_final.index), sort=False)
+    rng = np.random.default_rng(seed)
+
+    # Sampel per segmen tanpa loop: acak urutan baris, ambil n pertama tiap kode
+    order = rng.permutation(len(codes))
+    order = order[codes[order] >= 0]
+    if sample_size:
+        n_segments = max(len(np.unique(codes[order])), 1)
+        sample_per_segment = max(SEGMENT_MIN_SAMPLE, sample_size // n_segments)
+        rank_in_segment = pd.Series(codes[order]).groupby(codes[order]).cumcount().to_numpy()
+        order = order[rank_in_segment < sample_per_segment]
+    order.sort()
+
+    X = build_model_frame(df_final.iloc[order], mapping_detail, feature_names)
+    preprocessor = preprocessor or get_reference_preprocessor(feature_names)
+    contribs = shap_contributions(model, preprocessor.transform(X), feature_names,
+                                  chunk_size=chunk_size, n_threads=n_threads)
+
+    importances = pd.DataFrame(np.abs(contribs), columns=feature_names).groupby(codes[order]).mean()
+    importances.index = labels[importances.index]
+    return importances
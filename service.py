@@ -0,0 +1,470 @@
+"""
+Service HTTP lokal untuk mapping, scoring kepuasan per pelanggan, dan ranking TOPSIS
+tanpa UI Streamlit.
+
+Endpoint:
+    GET  /health   status model
+    POST /map      {"columns": [...], "source": opsional} -> mapping kolom -> feature model
+    POST /score    {"records": [{kolom: nilai}, ...]} -> probabilitas HighSatisfaction per record
+                   (422 + kolom yang tidak ter-map jika fitur cocok < min_features)
+    POST /rank     {"records": [...], "importance": "global"/"shap"} atau {"importances": {feature: nilai}}
+                   -> ranking strategi
+    GET  /metrics  latency per endpoint dan statistik micro-batching
+    GET  /metrics/prometheus  durasi/baris/memori per stage analisis (format teks Prometheus)
+
+Jalankan: python service.py --port 8000
+Model, preprocessor dan acuan fitur turunan (dari dataset training) dimuat sekali saat
+startup, sehingga skor satu record sama baik dikirim sendiri maupun dalam batch.
+Request /score yang datang bersamaan digabung oleh MicroBatcher menjadi satu panggilan XGBoost.
+"""
+import argparse
+import asyncio
+import contextlib
+import json
+import time
+from collections import defaultdict, deque
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, PlainTextResponse
+from starlette.routing import Route
+
+from data_mapping import (
+    REFERENCE_FILE,
+    get_cached_model_features,
+    get_feature_reference,
+    map_dataset_to_features,
+    mapping_methods,
+    resolve_feature_columns,
+)
+from errors import DSSError
+from instrumentation import prometheus_text
+from pipeline import build_decision_matrix, compute_importance, rank_strategies
+from scoring import build_model_frame, get_reference_preprocessor, predict_satisfaction, set_model_threads
+
+DEFAULT_MODEL_FILE = "model_satisfied_v2.pkl"
+DEFAULT_FEATURE_NAMES_FILE = "feature_names.pkl"
+# Dataset acuan untuk fit preprocessing (median/modus, batas IQR, scaler) dan
+# kategori/ambang fitur turunan, sekali saat startup
+DEFAULT_REFERENCE_FILE = REFERENCE_FILE
+DEFAULT_MIN_FEATURES = 5
+# Sumber importance untuk /rank dari records
+IMPORTANCE_SOURCES = ("global", "shap")
+
+MAX_BATCH_ROWS = 50_000
+MAX_WAIT_MS = 5.0
+
+# ======================================================================
+# MICRO-BATCHING
+# ======================================================================
+class MicroBatcher:
+    """
+    Menggabungkan matriks input dari request yang datang bersamaan menjadi satu batch.
+    Batch dikirim saat mencapai max_batch_rows atau setelah menunggu max_wait_ms sejak
+    request pertama; prediksi dijalankan di thread pool agar event loop tidak terblokir.
+    """
+
+    def __init__(self, predict_fn: Callable[[np.ndarray], np.ndarray],
+                 max_batch_rows: int = MAX_BATCH_ROWS,
+                 max_wait_ms: float = MAX_WAIT_MS):
+        self.predict_fn = predict_fn
+        self.max_batch_rows = max_batch_rows
+        self.max_wait = max_wait_ms / 1000
+        self.batches = 0
+        self.requests = 0
+        self.rows = 0
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        self._queue = asyncio.Queue()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def predict(self, X: np.ndarray) -> np.ndarray:
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((X, future))
+        return await future
+
+    async def _collect(self) -> List[Tuple[np.ndarray, asyncio.Future]]:
+        items = [await self._queue.get()]
+        n_rows = len(items[0][0])
+        deadline = asyncio.get_running_loop().time() + self.max_wait
+        while n_rows < self.max_batch_rows:
+            timeout = deadline - asyncio.get_running_loop().time()
+            if timeout <= 0:
+                break
+            try:
+                item = await asyncio.wait_for(self._queue.get(), timeout)
+            except asyncio.TimeoutError:
+                break
+            items.append(item)
+            n_rows += len(item[0])
+        return items
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            items = await self._collect()
+            X = np.concatenate([x for x, _ in items]) if len(items) > 1 else items[0][0]
+            try:
+                proba = await loop.run_in_executor(None, self.predict_fn, X)
+            except Exception as e:
+                for _, future in items:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            self.batches += 1
+            self.requests += len(items)
+            self.rows += len(X)
+            start = 0
+            for x, future in items:
+                if not future.done():
+                    future.set_result(proba[start:start + len(x)])
+                start += len(x)
+
+    def stats(self) -> Dict:
+        return {
+            'batches': self.batches,
+            'requests': self.requests,
+            'rows': self.rows,
+            'mean_requests_per_batch': self.requests / self.batches if self.batches else 0.0,
+        }
+
+# ======================================================================
+# METRIK LATENCY
+# ======================================================================
+class LatencyMetrics:
+    """Latency request per endpoint (jumlah, rata-rata, persentil dari window terakhir)"""
+
+    def __init__(self, window: int = 10_000):
+        self.window = window
+        self.counts: Dict[str, int] = defaultdict(int)
+        self.errors: Dict[str, int] = defaultdict(int)
+        self.totals: Dict[str, float] = defaultdict(float)
+        self.recent: Dict[str, deque] = defaultdict(lambda: deque(maxlen=self.window))
+
+    def observe(self, endpoint: str, seconds: float, error: bool = False) -> None:
+        self.counts[endpoint] += 1
+        self.errors[endpoint] += int(error)
+        self.totals[endpoint] += seconds
+        self.recent[endpoint].append(seconds)
+
+    def summary(self) -> Dict[str, Dict]:
+        result = {}
+        for endpoint, count in self.counts.items():
+            recent = np.array(self.recent[endpoint]) * 1000
+            p50, p95, p99 = np.percentile(recent, [50, 95, 99])
+            result[endpoint] = {
+                'count': count,
+                'errors': self.errors[endpoint],
+                'mean_ms': self.totals[endpoint] / count * 1000,
+                'p50_ms': p50,
+                'p95_ms': p95,
+                'p99_ms': p99,
+            }
+        return result
+
+# ======================================================================
+# STATE SERVICE (MODEL WARM)
+# ======================================================================
+class ScoringService:
+    """Model, feature names, preprocessor dan acuan fitur turunan yang dimuat sekali per proses service"""
+
+    def __init__(self, model_file: str = DEFAULT_MODEL_FILE,
+                 feature_names_file: str = DEFAULT_FEATURE_NAMES_FILE,
+                 reference_file: str = DEFAULT_REFERENCE_FILE,
+                 min_features: int = DEFAULT_MIN_FEATURES,
+                 n_threads: Optional[int] = None,
+                 max_batch_rows: int = MAX_BATCH_ROWS,
+                 max_wait_ms: float = MAX_WAIT_MS):
+        self.model, self.feature_names = get_cached_model_features(model_file, feature_names_file)
+        self.reference_file = reference_file
+        self.min_features = min_features
+        self.n_threads = n_threads
+        set_model_threads(self.model, n_threads)
+        self.feature_reference = get_feature_reference(self.feature_names, reference_file)
+        self.preprocessor = get_reference_preprocessor(self.feature_names, reference_file)
+        self.batcher = MicroBatcher(self._predict, max_batch_rows, max_wait_ms)
+        self.metrics = LatencyMetrics()
+
+    def _predict(self, X: np.ndarray) -> np.ndarray:
+        return predict_satisfaction(self.model, X)
+
+    def map_records(self, records: List[Dict], source: Optional[str] = None,
+                    min_features: Optional[int] = None) -> Dict:
+        """
+        Mapping record mentah dengan fitur turunan dari acuan (bukan dari batch request).
+        Return dict: is_valid, message, mapping_detail, df_final, unmatched (kolom request yang tidak ter-map)
+        """
+        df = pd.DataFrame.from_records(records)
+        min_features = self.min_features if min_features is None else int(min_features)
+        is_valid, message, _, _, mapping_detail, df_final = map_dataset_to_features(
+            df, self.feature_names, min_features, source=source, reference=self.feature_reference
+        )
+        mapped = set(mapping_detail.values())
+        return {
+            'is_valid': is_valid,
+            'message': message,
+            'mapping_detail': mapping_detail,
+            'df_final': df_final,
+            'unmatched': [str(c) for c in df.columns if c not in mapped],
+        }
+
+    def model_input(self, records: List[Dict], source: Optional[str] = None,
+                    min_features: Optional[int] = None) -> Tuple[Optional[np.ndarray], Dict]:
+        """
+        Record mentah -> matriks input model (mapping + fitur turunan + preprocessing acuan).
+        Return: (matriks, hasil map_records); matriks None jika fitur cocok < min_features
+        """
+        mapping = self.map_records(records, source, min_features)
+        if not mapping['is_valid']:
+            return None, mapping
+        X = build_model_frame(mapping['df_final'], mapping['mapping_detail'], self.feature_names)
+        return self.preprocessor.transform(X), mapping
+
+# ======================================================================
+# ENDPOINT
+# ======================================================================
+def _timed(endpoint: str):
+    def decorator(handler):
+        async def wrapper(request: Request) -> JSONResponse:
+            service: ScoringService = request.app.state.service
+            start = time.perf_counter()
+            try:
+                response = await handler(request, service)
+            except (ValueError, KeyError, TypeError) as e:
+                response = JSONResponse({'error': f"Request tidak valid: {e}"}, status_code=400)
+            except DSSError as e:
+                response = JSONResponse({'error': str(e)}, status_code=500)
+            service.metrics.observe(endpoint, time.perf_counter() - start, error=response.status_code >= 400)
+            return response
+        return wrapper
+    return decorator
+
+async def _json_body(request: Request) -> Dict:
+    try:
+        body = await request.json()
+    except json.JSONDecodeError as e:
+        raise ValueError(f"body bukan JSON ({e})")
+    if not isinstance(body, dict):
+        raise ValueError("body harus berupa object JSON")
+    return body
+
+def _records(body: Dict) -> List[Dict]:
+    records = body.get('records')
+    if not isinstance(records, list) or not records:
+        raise ValueError("'records' harus berupa list object yang tidak kosong")
+    return records
+
+@_timed("health")
+async def health(request: Request, service: ScoringService) -> JSONResponse:
+    return JSONResponse({
+        'status': 'ok',
+        'features': len(service.feature_names),
+        'reference_file': service.reference_file,
+    })
+
+@_timed("map")
+async def map_columns(request: Request, service: ScoringService) -> JSONResponse:
+    body = await _json_body(request)
+    columns = body.get('columns')
+    if not isinstance(columns, list):
+        raise ValueError("'columns' harus berupa list nama kolom")
+    source = body.get('source')
+    mapping_detail, _, missing = resolve_feature_columns(columns, service.feature_names, source)
+    return JSONResponse({
+        'mapping': mapping_detail,
+        'methods': mapping_methods(columns, service.feature_names, source),
+        'missing': missing,
+    })
+
+@_timed("score")
+async def score(request: Request, service: ScoringService) -> JSONResponse:
+    body = await _json_body(request)
+    X, mapping = await asyncio.get_running_loop().run_in_executor(
+        None, service.model_input, _records(body), body.get('source'), body.get('min_features')
+    )
+    if X is None:
+        return JSONResponse({'error': mapping['message'], 'unmatched_columns': mapping['unmatched']},
+                            status_code=422)
+    proba = await service.batcher.predict(X)
+    return JSONResponse({
+        'probabilities': [float(p) for p in proba],
+        'features_matched': len(mapping['mapping_detail']),
+    })
+
+@_timed("rank")
+async def rank(request: Request, service: ScoringService) -> JSONResponse:
+    body = await _json_body(request)
+    top_k = body.get('top_k')
+    if 'importances' in body:
+        importances = pd.Series(body['importances'], dtype=float)
+        if not np.isfinite(importances).all() or importances.sum() <= 0:
+            raise ValueError("'importances' harus berupa angka dengan jumlah positif")
+        importances = importances / importances.sum()
+    else:
+        importance_source = body.get('importance', 'global')
+        if importance_source not in IMPORTANCE_SOURCES:
+            raise ValueError(f"'importance' harus salah satu dari {list(IMPORTANCE_SOURCES)}")
+        loop = asyncio.get_running_loop()
+        mapping = await loop.run_in_executor(
+            None, service.map_records, _records(body), body.get('source'), body.get('min_features')
+        )
+        if not mapping['is_valid']:
+            return JSONResponse({'error': mapping['message'], 'unmatched_columns': mapping['unmatched']},
+                                status_code=422)
+        importances = await loop.run_in_executor(
+            None, compute_importance, service.model, mapping, service.feature_names,
+            importance_source, service.preprocessor
+        )
+
+    results = rank_strategies(build_decision_matrix(importances))
+    if results is None:
+        return JSONResponse({'error': "Tidak ada strategi yang cocok dengan features yang terdeteksi."},
+                            status_code=422)
+    if top_k is not None:
+        results = results.head(int(top_k))
+    return JSONResponse({'ranking': [
+        {'strategy': strategy, 'closeness_score': float(row['Closeness_Score']), 'rank': int(row['Rank'])}
+        for strategy, row in results.iterrows()
+    ]})
+
+@_timed("metrics")
+async def metrics(request: Request, service: ScoringService) -> JSONResponse:
+    return JSONResponse({'latency': service.metrics.summary(), 'batching': service.batcher.stats()})
+
+@_timed("metrics")
+async def metrics_prometheus(request: Request, service: ScoringService) -> PlainTextResponse:
+    return PlainTextResponse(prometheus_text(), media_type="text/plain; version=0.0.4")
+
+def create_app(**service_kwargs) -> Starlette:
+    """
+    Buat aplikasi ASGI. Model dan preprocessor dimuat saat startup (lifespan),
+    kwargs diteruskan ke ScoringService.
+    """
+    @contextlib.asynccontextmanager
+    async def lifespan(app: Starlette):
+        app.state.service = ScoringService(**service_kwargs)
+        app.state.service.batcher.start()
+        try:
+            yield
+        finally:
+            await app.state.service.batcher.stop()
+
+    return Starlette(routes=[
+        Route("/health", health, methods=["GET"]),
+        Route("/map", map_columns, methods=["POST"]),
+        Route("/score", score, methods=["POST"]),
+        Route("/rank", rank, methods=["POST"]),
+        Route("/metrics", metrics, methods=["GET"]),
+        Route("/metrics/prometheus", metrics_prometheus, methods=["GET"]),
+    ], lifespan=lifespan)
+
+# ======================================================================
+# CLIENT IN-PROCESS (UNTUK UJI LOKAL)
+# ======================================================================
+class LocalClient:
+    """
+    Client ASGI in-process tanpa jaringan, termasuk startup/shutdown lifespan.
+        async with LocalClient(create_app()) as client:
+            status, body = await client.post("/score", {"records": [...]})
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self._lifespan_queue: Optional[asyncio.Queue] = None
+        self._lifespan_task: Optional[asyncio.Task] = None
+        self._lifespan_events: Optional[asyncio.Queue] = None
+
+    async def __aenter__(self) -> "LocalClient":
+        self._lifespan_queue = asyncio.Queue()
+        self._lifespan_events = asyncio.Queue()
+        scope = {'type': 'lifespan', 'asgi': {'version': '3.0'}, 'state': {}}
+        self._lifespan_task = asyncio.get_running_loop().create_task(
+            self.app(scope, self._lifespan_queue.get, self._lifespan_events.put)
+        )
+        await self._lifespan_queue.put({'type': 'lifespan.startup'})
+        event = await self._lifespan_events.get()
+        if event['type'] != 'lifespan.startup.complete':
+            raise RuntimeError(f"Startup service gagal: {event.get('message', '')}")
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self._lifespan_queue.put({'type': 'lifespan.shutdown'})
+        await self._lifespan_events.get()
+        await self._lifespan_task
+
+    async def request(self, method: str, path: str, payload: Optional[Dict] = None) -> Tuple[int, Dict]:
+        body = json.dumps(payload).encode("utf-8") if payload is not None else b""
+        path, _, query = path.partition("?")
+        scope = {
+            'type': 'http', 'asgi': {'version': '3.0'}, 'http_version': '1.1',
+            'method': method.upper(), 'scheme': 'http', 'path': path, 'raw_path': path.encode(),
+            'query_string': query.encode(), 'root_path': '',
+            'headers': [(b'content-type', b'application/json'), (b'content-length', str(len(body)).encode())],
+            'client': ('127.0.0.1', 0), 'server': ('localhost', 80), 'state': {},
+        }
+        messages = [{'type': 'http.request', 'body': body, 'more_body': False}]
+
+        async def receive() -> Dict:
+            return messages.pop(0) if messages else {'type': 'http.disconnect'}
+
+        response = {'status': 500, 'body': b'', 'json': True}
+
+        async def send(message: Dict) -> None:
+            if message['type'] == 'http.response.start':
+                response['status'] = message['status']
+                headers = dict(message.get('headers', []))
+                response['json'] = headers.get(b'content-type', b'').startswith(b'application/json')
+            elif message['type'] == 'http.response.body':
+                response['body'] += message.get('body', b'')
+
+        await self.app(scope, receive, send)
+        if not response['json']:
+            return response['status'], {'text': response['body'].decode("utf-8")}
+        data = json.loads(response['body']) if response['body'] else {}
+        return response['status'], data
+
+    async def get(self, path: str) -> Tuple[int, Dict]:
+        return await self.request("GET", path)
+
+    async def post(self, path: str, payload: Dict) -> Tuple[int, Dict]:
+        return await self.request("POST", path, payload)
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Service HTTP scoring & ranking strategi restoran")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--model", default=DEFAULT_MODEL_FILE)
+    parser.add_argument("--feature-names", default=DEFAULT_FEATURE_NAMES_FILE)
+    parser.add_argument("--reference", default=DEFAULT_REFERENCE_FILE,
+                        help="CSV training acuan untuk fit preprocessing dan fitur turunan")
+    parser.add_argument("--min-features", type=int, default=DEFAULT_MIN_FEATURES,
+                        help="Minimal kolom request yang ter-map ke feature model")
+    parser.add_argument("--threads", type=int, default=None, help="Thread XGBoost")
+    parser.add_argument("--max-batch-rows", type=int, default=MAX_BATCH_ROWS)
+    parser.add_argument("--max-wait-ms", type=float, default=MAX_WAIT_MS)
+    args = parser.parse_args(argv)
+
+    import uvicorn
+
+    app = create_app(model_file=args.model, feature_names_file=args.feature_names,
+                     reference_file=args.reference, min_features=args.min_features, n_threads=args.threads,
+                     max_batch_rows=args.max_batch_rows, max_wait_ms=args.max_wait_ms)
+    uvicorn.run(app, host=args.host, port=args.port)
+
+if __name__ == "__main__":
+    main()
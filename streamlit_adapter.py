@@ -0,0 +1,24 @@
+import streamlit as st
+from typing import Optional, Tuple
+
+from data_mapping import get_cached_model_features
+from errors import DSSError
+
+# ======================================================================
+# ADAPTER STREAMLIT
+# ======================================================================
+# Lapisan tipis antara library inti dan UI: memanggil API library lalu
+# menerjemahkan error terstruktur menjadi pesan Streamlit.
+
+def show_error(error: Exception, prefix: Optional[str] = None) -> None:
+    """Tampilkan exception sebagai st.error (DSSError memakai message terstrukturnya)"""
+    text = str(error) if isinstance(error, DSSError) else f"{prefix or 'Error'}: {error}"
+    st.error(f"❌ {text}")
+
+def load_model_features(model_file: str, feature_names_file: str) -> Tuple[Optional[object], Optional[list]]:
+    """Model dari registry proses; jika gagal, error ditampilkan dan (None, None) dikembalikan"""
+    try:
+        return get_cached_model_features(model_file, feature_names_file)
+    except DSSError as e:
+        show_error(e)
+        return None, None
@@ -0,0 +1,100 @@
+import json
+import os
+import threading
+from typing import Dict, List, Optional
+
+# ======================================================================
+# SYNONYM STORE (PERSISTEN, BISA BELAJAR)
+# ======================================================================
+# Sinonim disimpan per scope: "global" berlaku untuk semua sumber data, scope lain
+# (mis. nama vendor POS) hanya berlaku untuk upload dari sumber tersebut.
+# Setiap scope adalah indeks hash {kolom ternormalisasi: feature ternormalisasi}, dimuat sekali.
+
+GLOBAL_SCOPE = "global"
+
+def normalize_column_name(col) -> str:
+    """Normalisasi nama kolom: lowercase tanpa '_', '-' dan spasi"""
+    return str(col).lower().replace("_", "").replace("-", "").replace(" ", "")
+
+class SynonymStore:
+    """
+    Kamus sinonim kolom -> feature yang dimuat sekali dari file JSON dan
+    diperluas lewat learn() ketika user mengonfirmasi hasil fuzzy match.
+    """
+
+    def __init__(self, path: Optional[str] = None, defaults: Optional[Dict[str, List[str]]] = None):
+        self.path = path
+        self._lock = threading.Lock()
+        # scope -> {kolom ternormalisasi: feature ternormalisasi}
+        self._scopes: Dict[str, Dict[str, str]] = {GLOBAL_SCOPE: {}}
+        # scope -> jumlah perubahan, dipakai sebagai bagian dari key cache mapping
+        self._revisions: Dict[str, int] = {GLOBAL_SCOPE: 0}
+
+        self._defaults: Dict[str, str] = {}
+        for feature, synonyms in (defaults or {}).items():
+            for syn in synonyms:
+                self._defaults.setdefault(normalize_column_name(syn), normalize_column_name(feature))
+        self._scopes[GLOBAL_SCOPE].update(self._defaults)
+        if path and os.path.exists(path):
+            self._load(path)
+
+    def _load(self, path: str) -> None:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                stored = json.load(f)
+        except (OSError, ValueError):
+            return
+        for scope, entries in stored.get("scopes", {}).items():
+            self._scopes.setdefault(scope, {}).update(entries)
+        self._revisions.update({k: int(v) for k, v in stored.get("revisions", {}).items()})
+
+    def _save(self) -> None:
+        if not self.path:
+            return
+        tmp_file = self.path + ".tmp"
+        try:
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                # Sinonim bawaan tidak ikut disimpan, hanya yang dipelajari
+                scopes = dict(self._scopes)
+                scopes[GLOBAL_SCOPE] = {k: v for k, v in scopes[GLOBAL_SCOPE].items()
+                                        if self._defaults.get(k) != v}
+                json.dump({"scopes": scopes, "revisions": self._revisions}, f, indent=2)
+            os.replace(tmp_file, self.path)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _scope(source: Optional[str]) -> str:
+        return normalize_column_name(source) if source else GLOBAL_SCOPE
+
+    def lookup(self, column: str, source: Optional[str] = None) -> Optional[str]:
+        """Feature ternormalisasi untuk satu kolom (O(1)), None jika tidak dikenal"""
+        col_norm = normalize_column_name(column)
+        scope = self._scope(source)
+        with self._lock:
+            return self._scopes.get(scope, {}).get(col_norm, self._scopes[GLOBAL_SCOPE].get(col_norm))
+
+    def revision(self, source: Optional[str] = None) -> str:
+        """Versi isi store yang relevan untuk sumber ini (berubah setiap kali learn)"""
+        scope = self._scope(source)
+        with self._lock:
+            return f"{self._revisions.get(GLOBAL_SCOPE, 0)}.{self._revisions.get(scope, 0)}"
+
+    def learn(self, feature: str, column: str, source: Optional[str] = None) -> bool:
+        """
+        Simpan pasangan kolom -> feature ke scope sumber (atau global) lalu persist ke disk.
+        Return True jika store berubah.
+        """
+        col_norm = normalize_column_name(column)
+        feat_norm = normalize_column_name(feature)
+        if col_norm == feat_norm:
+            return False
+        scope = self._scope(source)
+        with self._lock:
+            entries = self._scopes.setdefault(scope, {})
+            if entries.get(col_norm) == feat_norm:
+                return False
+            entries[col_norm] = feat_norm
+            self._revisions[scope] = self._revisions.get(scope, 0) + 1
+            self._save()
+        return True
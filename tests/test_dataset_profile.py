@@ -0,0 +1,98 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from dataset_profile import DatasetProfile, HyperLogLog, TDigest
+
+# Galat standar HLL = 1.04 / sqrt(2^p); batas uji 3 galat standar
+HLL_PRECISION = 12
+HLL_BOUND = 3 * 1.04 / np.sqrt(1 << HLL_PRECISION)
+
+def distinct_hashes(rng, n):
+    return pd.util.hash_array(rng.choice(2 ** 62, size=n, replace=False))
+
+@pytest.mark.parametrize("n", [100, 1_000, 20_000, 200_000, 1_000_000])
+def test_hll_relative_error_within_bound(n):
+    rng = np.random.default_rng(n)
+    hll = HyperLogLog(HLL_PRECISION)
+    hll.add_hashes(distinct_hashes(rng, n))
+    assert abs(hll.estimate() / n - 1) <= HLL_BOUND
+
+def test_hll_ignores_duplicates():
+    hashes = distinct_hashes(np.random.default_rng(1), 50_000)
+    hll = HyperLogLog(HLL_PRECISION)
+    hll.add_hashes(hashes)
+    registers = hll.registers.copy()
+    hll.add_hashes(hashes[::-1])
+    np.testing.assert_array_equal(hll.registers, registers)
+
+def test_hll_merge_equals_union():
+    hashes = distinct_hashes(np.random.default_rng(2), 100_000)
+    left, right, union = HyperLogLog(HLL_PRECISION), HyperLogLog(HLL_PRECISION), HyperLogLog(HLL_PRECISION)
+    left.add_hashes(hashes[:60_000])
+    right.add_hashes(hashes[40_000:])
+    union.add_hashes(hashes)
+    left.merge(right)
+    assert left.estimate() == union.estimate()
+    assert abs(left.estimate() / len(hashes) - 1) <= HLL_BOUND
+
+def test_hll_empty():
+    assert HyperLogLog(HLL_PRECISION).estimate() == 0.0
+
+# t-digest: galat rank (fraksi data <= estimasi kuantil dikurangi q)
+QS = [0.001, 0.01, 0.1, 0.25, 0.5, 0.75, 0.9, 0.99, 0.999]
+TDIGEST_RANK_BOUND = 1e-3
+
+def rank_errors(values, estimates):
+    return np.searchsorted(np.sort(values), estimates) / len(values) - np.asarray(QS)
+
+@pytest.mark.parametrize("distribution", ["normal", "exponential", "lognormal"])
+def test_tdigest_rank_error_within_bound(distribution):
+    rng = np.random.default_rng(3)
+    values = getattr(rng, distribution)(size=1_000_000)
+    digest = TDigest()
+    for chunk in np.array_split(values, 37):
+        digest.add(chunk)
+    estimates = digest.quantiles(QS)
+
+    assert not digest.is_exact
+    assert len(digest.weights) <= digest.compression
+    assert np.abs(rank_errors(values, estimates)).max() <= TDIGEST_RANK_BOUND
+
+def test_tdigest_many_duplicates():
+    values = np.random.default_rng(4).integers(1, 6, size=300_000).astype(float)
+    digest = TDigest()
+    for chunk in np.array_split(values, 10):
+        digest.add(chunk)
+    np.testing.assert_allclose(digest.quantiles([0.25, 0.5, 0.75]), np.quantile(values, [0.25, 0.5, 0.75]),
+                               atol=0.5)
+
+def test_tdigest_exact_below_buffer():
+    values = np.random.default_rng(5).normal(size=10_000)
+    digest = TDigest(buffer_size=50_000)
+    digest.add(values[:4_000])
+    digest.add(values[4_000:])
+    assert digest.is_exact
+    np.testing.assert_allclose(digest.quantiles(QS), np.quantile(values, QS))
+
+def test_tdigest_extremes_are_exact():
+    values = np.random.default_rng(6).uniform(-5.0, 5.0, size=200_000)
+    digest = TDigest(buffer_size=10_000)
+    for chunk in np.array_split(values, 20):
+        digest.add(chunk)
+    assert digest.quantiles([0.0, 1.0]) == [values.min(), values.max()]
+
+def test_tdigest_empty():
+    assert np.isnan(TDigest().quantiles([0.5])).all()
+
+def test_profile_distinct_counts_within_bound():
+    rng = np.random.default_rng(7)
+    df = pd.DataFrame({
+        'id': np.arange(120_000),
+        'rating': rng.integers(1, 6, size=120_000),
+        'name': rng.choice([f"n{i}" for i in range(3_000)], size=120_000),
+    })
+    profile = DatasetProfile.from_dataframe(df, chunksize=25_000)
+    exact = df.nunique()
+    estimated = profile.distinct_counts()[exact.index]
+    assert (np.abs(estimated / exact - 1) <= HLL_BOUND).all()
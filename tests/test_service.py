@@ -0,0 +1,81 @@
+import asyncio
+import os
+
+import pandas as pd
+import pytest
+
+from service import LocalClient, create_app
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODEL_FILE = os.path.join(ROOT, "model_satisfied_v2.pkl")
+FEATURE_NAMES_FILE = os.path.join(ROOT, "feature_names.pkl")
+DATASET_FILE = os.path.join(ROOT, "restaurant_customer_satisfaction.csv")
+
+@pytest.fixture(scope="module")
+def records():
+    df = pd.read_csv(DATASET_FILE).drop(columns=['HighSatisfaction'])
+    return df.head(50).to_dict('records')
+
+def call(*requests):
+    """Jalankan request (method, path, payload) berurutan pada satu LocalClient"""
+    async def main():
+        app = create_app(model_file=MODEL_FILE, feature_names_file=FEATURE_NAMES_FILE)
+        async with LocalClient(app) as client:
+            return [await client.request(*req) for req in requests]
+    return asyncio.run(main())
+
+def test_health():
+    [(status, body)] = call(("GET", "/health"))
+    assert status == 200
+    assert body['status'] == 'ok'
+    assert body['features'] == 42
+
+def test_score_returns_one_probability_per_record(records):
+    [(status, body)] = call(("POST", "/score", {'records': records}))
+    assert status == 200
+    assert len(body['probabilities']) == len(records)
+    assert all(0.0 <= p <= 1.0 for p in body['probabilities'])
+
+def test_score_does_not_depend_on_batch(records):
+    (_, batch), (_, single) = call(("POST", "/score", {'records': records}),
+                                   ("POST", "/score", {'records': records[:1]}))
+    assert single['probabilities'][0] == pytest.approx(batch['probabilities'][0], abs=1e-6)
+
+def test_score_rejects_invalid_body():
+    (empty_status, _), (json_status, _) = call(("POST", "/score", {'records': []}),
+                                               ("POST", "/score"))
+    assert empty_status == 400
+    assert json_status == 400
+
+def test_score_unmapped_columns_is_422():
+    [(status, body)] = call(("POST", "/score", {'records': [{'Foo': 1, 'Bar': 2}]}))
+    assert status == 422
+    assert sorted(body['unmatched_columns']) == ['Bar', 'Foo']
+
+@pytest.mark.parametrize("importance", ["global", "shap"])
+def test_rank_from_records(records, importance):
+    [(status, body)] = call(("POST", "/rank", {'records': records, 'importance': importance, 'top_k': 3}))
+    assert status == 200
+    assert [row['rank'] for row in body['ranking']] == [1, 2, 3]
+    scores = [row['closeness_score'] for row in body['ranking']]
+    assert scores == sorted(scores, reverse=True)
+
+def test_rank_from_importances():
+    importances = {'ServiceRating': 0.5, 'WaitTime': 0.3, 'FoodRating': 0.2}
+    [(status, body)] = call(("POST", "/rank", {'importances': importances, 'top_k': 2}))
+    assert status == 200
+    assert len(body['ranking']) == 2
+
+def test_rank_rejects_invalid_requests(records):
+    responses = call(
+        ("POST", "/rank", {'importances': {'ServiceRating': 0, 'WaitTime': 0}}),
+        ("POST", "/rank", {'importances': {'ServiceRating': -1}}),
+        ("POST", "/rank", {'records': records, 'importance': 'unknown'}),
+        ("POST", "/rank", {'records': []}),
+    )
+    assert [status for status, _ in responses] == [400, 400, 400, 400]
+
+def test_rank_unmapped_columns_is_422():
+    [(status, body)] = call(("POST", "/rank", {'records': [{'Foo': 1}]}))
+    assert status == 422
+    assert body['unmatched_columns'] == ['Foo']
@@ -0,0 +1,126 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from topsis_utils import (
+    PreparedTopsis, benefit_mask, calculate_topsis, topsis_column_stats, topsis_top_k
+)
+
+CRITERIA = ['Benefit', 'Cost', 'Benefit', 'Cost', 'Benefit']
+
+@pytest.fixture
+def alternatives(tmp_path):
+    """Matriks 500 × 5 sebagai file .npy (dibuka memory-mapped oleh topsis_top_k)"""
+    X = np.random.default_rng(7).uniform(0.0, 10.0, size=(500, len(CRITERIA)))
+    path = tmp_path / "alternatives.npy"
+    np.save(path, X)
+    return X, str(path)
+
+def reference_ranking(X, weights):
+    frame = pd.DataFrame(X, columns=[f"C{i}" for i in range(X.shape[1])])
+    return calculate_topsis(frame, weights, CRITERIA)
+
+def test_column_stats_match_prepared_topsis(alternatives):
+    X, path = alternatives
+    norms, R_plus, R_minus = topsis_column_stats(np.load(path, mmap_mode='r'), benefit_mask(CRITERIA),
+                                                 chunk_size=64)
+    prepared = PreparedTopsis(pd.DataFrame(X), CRITERIA)
+    np.testing.assert_allclose(norms, np.sqrt((X ** 2).sum(axis=0)))
+    np.testing.assert_allclose(R_plus, prepared.R_plus)
+    np.testing.assert_allclose(R_minus, prepared.R_minus)
+
+@pytest.mark.parametrize("chunk_size", [37, 128, 10_000])
+def test_top_k_matches_calculate_topsis(alternatives, chunk_size):
+    X, path = alternatives
+    weights = [0.3, 0.2, 0.2, 0.2, 0.1]
+    expected = reference_ranking(X, weights).head(10)
+    result = topsis_top_k(path, weights, CRITERIA, k=10, chunk_size=chunk_size, n_threads=2)
+
+    assert list(result.index) == list(expected.index)
+    np.testing.assert_allclose(result['Closeness_Score'], expected['Closeness_Score'], rtol=1e-5)
+    assert list(result['Rank']) == list(range(1, 11))
+    assert result.attrs['n_alternatives'] == len(X)
+
+def test_top_k_labels(alternatives):
+    X, path = alternatives
+    labels = [f"alt-{i}" for i in range(len(X))]
+    result = topsis_top_k(path, [1] * len(CRITERIA), CRITERIA, k=3, labels=labels)
+    expected = reference_ranking(X, [1] * len(CRITERIA)).head(3)
+    assert list(result.index) == [labels[i] for i in expected.index]
+
+def test_top_k_larger_than_alternatives_returns_all(alternatives):
+    X, path = alternatives
+    weights = [1] * len(CRITERIA)
+    result = topsis_top_k(path, weights, CRITERIA, k=len(X) + 100, chunk_size=64)
+    expected = reference_ranking(X, weights)
+    assert len(result) == len(X)
+    assert list(result.index) == list(expected.index)
+
+def test_top_k_one(alternatives):
+    X, path = alternatives
+    result = topsis_top_k(path, [1] * len(CRITERIA), CRITERIA, k=1, chunk_size=64)
+    assert list(result.index) == list(reference_ranking(X, [1] * len(CRITERIA)).index[:1])
+
+@pytest.mark.parametrize("k", [0, -3])
+def test_top_k_rejects_non_positive_k(alternatives, k):
+    _, path = alternatives
+    with pytest.raises(ValueError):
+        topsis_top_k(path, [1] * len(CRITERIA), CRITERIA, k=k)
+
+def test_top_k_rejects_mismatched_weights(alternatives):
+    _, path = alternatives
+    with pytest.raises(ValueError):
+        topsis_top_k(path, [1, 1], CRITERIA, k=5)
+
+def textbook_topsis(decision_matrix, weights, criteria_type):
+    """TOPSIS langkah demi langkah (matriks terbobot V, solusi ideal dari V) sebagai acuan"""
+    weights = np.asarray(weights, dtype=float) / np.sum(weights)
+    X = np.nan_to_num(decision_matrix.values, nan=0.0)
+    denominator = np.sqrt((X ** 2).sum(axis=0))
+    denominator[denominator == 0] = 1e-9
+    V = X / denominator * weights
+    benefit = benefit_mask(criteria_type)
+    A_plus = np.where(benefit, V.max(axis=0), V.min(axis=0))
+    A_minus = np.where(benefit, V.min(axis=0), V.max(axis=0))
+    S_plus = np.sqrt(((V - A_plus) ** 2).sum(axis=1))
+    S_minus = np.sqrt(((V - A_minus) ** 2).sum(axis=1))
+    closeness = pd.Series(S_minus / (S_plus + S_minus), index=decision_matrix.index)
+    return pd.DataFrame({
+        'Closeness_Score': closeness,
+        'Rank': closeness.rank(method='dense', ascending=False).astype(int)
+    }).sort_values('Closeness_Score', ascending=False, kind='stable')
+
+def random_problem(rng):
+    S, F = rng.integers(2, 30), rng.integers(1, 12)
+    matrix = pd.DataFrame(rng.uniform(0.0, 100.0, size=(S, F)),
+                          index=[f"S{i}" for i in range(S)], columns=[f"F{j}" for j in range(F)])
+    criteria = list(rng.choice(['Benefit', 'Cost'], size=F))
+    return matrix, criteria
+
+def test_prepared_to_frame_matches_calculate_topsis():
+    rng = np.random.default_rng(2024)
+    for _ in range(200):
+        matrix, criteria = random_problem(rng)
+        weights = rng.uniform(0.01, 1.0, size=matrix.shape[1])
+        result = PreparedTopsis(matrix, criteria).to_frame(weights)
+        expected = calculate_topsis(matrix, list(weights), criteria)
+        pd.testing.assert_frame_equal(result, expected)
+
+def test_prepared_to_frame_matches_textbook_topsis():
+    rng = np.random.default_rng(2025)
+    for _ in range(200):
+        matrix, criteria = random_problem(rng)
+        weights = rng.uniform(0.01, 1.0, size=matrix.shape[1])
+        result = PreparedTopsis(matrix, criteria).to_frame(weights)
+        expected = textbook_topsis(matrix, weights, criteria)
+        assert list(result.index) == list(expected.index)
+        np.testing.assert_allclose(result['Closeness_Score'], expected['Closeness_Score'], rtol=1e-9)
+        assert list(result['Rank']) == list(expected['Rank'])
+
+def test_prepared_reranking_with_new_weights():
+    matrix, criteria = random_problem(np.random.default_rng(3))
+    prepared = PreparedTopsis(matrix, criteria)
+    rng = np.random.default_rng(4)
+    for _ in range(20):
+        weights = rng.uniform(0.01, 1.0, size=matrix.shape[1])
+        pd.testing.assert_frame_equal(prepared.to_frame(weights), calculate_topsis(matrix, list(weights), criteria))
@@ -1,43 +1,425 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 import pandas as pd
-from typing import List
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+from instrumentation import instrument
+
+def benefit_mask(criteria_type: List[str]) -> np.ndarray:
+    """
+    Mask boolean kriteria: True = benefit, False = cost
+    """
+    return np.array([str(c).lower() == 'benefit' for c in criteria_type], dtype=bool)
+
+def _vector_normalize(X: np.ndarray) -> np.ndarray:
+    X = np.nan_to_num(np.asarray(X, dtype=float), nan=0.0)
+    denominator = np.sqrt((X ** 2).sum(axis=0))
+    denominator[denominator == 0] = 1e-9
+    return X / denominator
+
+def _normalize_weights(weights) -> np.ndarray:
+    W = np.atleast_2d(np.asarray(weights, dtype=float))
+    if (W < 0).any():
+        raise ValueError("Bobot TOPSIS tidak boleh negatif")
+    totals = W.sum(axis=1, keepdims=True)
+    needs_norm = ~np.isclose(totals, 1.0)
+    return np.where(needs_norm, W / np.where(totals == 0, 1.0, totals), W)
+
+def _dense_rank_desc(scores: np.ndarray) -> np.ndarray:
+    """Dense ranking per baris (skor tertinggi = rank 1), setara pandas rank(method='dense')"""
+    order = np.argsort(-scores, axis=1)
+    sorted_scores = np.take_along_axis(scores, order, axis=1)
+    new_group = np.ones(sorted_scores.shape, dtype=bool)
+    new_group[:, 1:] = sorted_scores[:, 1:] != sorted_scores[:, :-1]
+    dense = np.cumsum(new_group, axis=1)
+    ranks = np.empty_like(dense)
+    np.put_along_axis(ranks, order, dense, axis=1)
+    return ranks
 
-def calculate_topsis(decision_matrix: pd.DataFrame, 
-                     weights: List[float], 
+def _ideal_distances(R: np.ndarray, benefit: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Kuadrat jarak per kriteria ke solusi ideal positif/negatif pada matriks ternormalisasi R.
+    Karena bobot >= 0, ideal dari V = R * w sama dengan w * ideal dari R, sehingga
+    S+ = sqrt((R - R+)^2 @ w^2) untuk setiap vektor bobot.
+    """
+    R_max = R.max(axis=0)
+    R_min = R.min(axis=0)
+    R_plus = np.where(benefit, R_max, R_min)
+    R_minus = np.where(benefit, R_min, R_max)
+    return (R - R_plus) ** 2, (R - R_minus) ** 2
+
+def _closeness(W: np.ndarray, D_plus: np.ndarray, D_minus: np.ndarray) -> np.ndarray:
+    W2 = W ** 2
+    S_plus = np.sqrt(W2 @ D_plus.T)
+    S_minus = np.sqrt(W2 @ D_minus.T)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return S_minus / (S_plus + S_minus)
+
+def topsis_scores(X, weights, benefit) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Engine TOPSIS NumPy untuk banyak skenario bobot sekaligus.
+    X: matriks keputusan (S alternatif × F kriteria), weights: (F,) atau (K, F),
+    benefit: mask boolean (F,). Return: (closeness K×S, rank K×S).
+    """
+    R = _vector_normalize(X)
+    W = _normalize_weights(weights)
+    D_plus, D_minus = _ideal_distances(R, np.asarray(benefit, dtype=bool))
+
+    closeness = _closeness(W, D_plus, D_minus)
+    return closeness, _dense_rank_desc(closeness)
+
+class PreparedTopsis:
+    """
+    Bagian TOPSIS yang tidak bergantung pada bobot, dihitung sekali per decision matrix:
+    matriks ternormalisasi R, mask benefit/cost, ekstrem kolom (solusi ideal) dan kuadrat
+    jarak per kriteria. Ranking ulang untuk bobot baru hanya butuh dua perkalian
+    matriks-vektor O(S·F), tanpa normalisasi ulang dan tanpa pandas.
+    """
+
+    def __init__(self, decision_matrix: pd.DataFrame, criteria_type: List[str]):
+        self.strategies = decision_matrix.index
+        self.criteria = decision_matrix.columns
+        self.benefit = benefit_mask(criteria_type)
+        self.R = _vector_normalize(decision_matrix.values)
+        self.R_plus = np.where(self.benefit, self.R.max(axis=0), self.R.min(axis=0))
+        self.R_minus = np.where(self.benefit, self.R.min(axis=0), self.R.max(axis=0))
+        self.D_plus = (self.R - self.R_plus) ** 2
+        self.D_minus = (self.R - self.R_minus) ** 2
+
+    def closeness(self, weights) -> np.ndarray:
+        """Closeness untuk satu (F,) atau banyak (K, F) vektor bobot: shape (K, S)"""
+        return _closeness(_normalize_weights(weights), self.D_plus, self.D_minus)
+
+    def rank(self, weights) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Ranking untuk satu vektor bobot.
+        Return: (urutan indeks strategi terbaik -> terburuk, closeness S, rank S)
+        """
+        closeness = self.closeness(weights)
+        ranks = _dense_rank_desc(closeness)[0]
+        closeness = closeness[0]
+        return np.argsort(-closeness, kind='stable'), closeness, ranks
+
+    def to_frame(self, weights) -> pd.DataFrame:
+        """Hasil dalam format calculate_topsis"""
+        order, closeness, ranks = self.rank(weights)
+        return pd.DataFrame({
+            'Strategy': self.strategies[order],
+            'Closeness_Score': closeness[order],
+            'Rank': ranks[order].astype(int)
+        }).set_index('Strategy')
+
+def prepare_topsis(decision_matrix: pd.DataFrame, criteria_type: List[str]) -> PreparedTopsis:
+    return PreparedTopsis(decision_matrix, criteria_type)
+
+@instrument("calculate_topsis")
+def calculate_topsis(decision_matrix: pd.DataFrame,
+                     weights: List[float],
                      criteria_type: List[str]) -> pd.DataFrame:
     """
     Melakukan perhitungan TOPSIS.
+    Untuk ranking ulang berkali-kali dengan bobot berbeda, pakai prepare_topsis sekali
+    lalu PreparedTopsis.rank(bobot).
     """
-    if not np.isclose(sum(weights), 1.0):
-        weights = np.array(weights) / sum(weights)
-    
-    X = np.nan_to_num(decision_matrix.values, nan=0.0)
-    denominator = np.sqrt((X ** 2).sum(axis=0))
+    return PreparedTopsis(decision_matrix, criteria_type).to_frame(weights)
+
+
+# ======================================================================
+# TOPSIS PER SEGMEN (BATCH G × S × F)
+# ======================================================================
+def topsis_scores_batched(X, weights, benefit) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    TOPSIS untuk G matriks keputusan sekaligus (satu per segmen).
+    X: (G segmen × S alternatif × F kriteria), weights: (G, F), benefit: (F,).
+    Normalisasi, solusi ideal dan jarak dihitung per segmen dalam satu operasi tensor.
+    Return: (closeness G×S, rank G×S)
+    """
+    X = np.nan_to_num(np.asarray(X, dtype=float), nan=0.0)
+    denominator = np.sqrt((X ** 2).sum(axis=1, keepdims=True))
     denominator[denominator == 0] = 1e-9
     R = X / denominator
-    V = R * np.array(weights)
-    
-    A_plus = np.zeros(V.shape[1])
-    A_minus = np.zeros(V.shape[1])
-    
-    for j in range(V.shape[1]):
-        if criteria_type[j].lower() == 'benefit':
-            A_plus[j] = V[:, j].max()
-            A_minus[j] = V[:, j].min()
-        elif criteria_type[j].lower() == 'cost':
-            A_plus[j] = V[:, j].min()
-            A_minus[j] = V[:, j].max()
-    
-    S_plus = np.sqrt(((V - A_plus)**2).sum(axis=1))
-    S_minus = np.sqrt(((V - A_minus)**2).sum(axis=1))
-    Closeness = S_minus / (S_plus + S_minus)
-    
-    closeness_series = pd.Series(Closeness, index=decision_matrix.index)
-    
+    W2 = _normalize_weights(weights) ** 2
+    benefit = np.asarray(benefit, dtype=bool)
+
+    R_max = R.max(axis=1, keepdims=True)
+    R_min = R.min(axis=1, keepdims=True)
+    R_plus = np.where(benefit, R_max, R_min)
+    R_minus = np.where(benefit, R_min, R_max)
+
+    S_plus = np.sqrt(np.einsum('gsf,gf->gs', (R - R_plus) ** 2, W2))
+    S_minus = np.sqrt(np.einsum('gsf,gf->gs', (R - R_minus) ** 2, W2))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        closeness = S_minus / (S_plus + S_minus)
+    return closeness, _dense_rank_desc(closeness)
+
+@instrument("calculate_segment_topsis", rows=lambda args, result: len(result))
+def calculate_segment_topsis(decision_tensor: np.ndarray,
+                             weights: np.ndarray,
+                             criteria_type: List[str],
+                             segments: List[str],
+                             strategies: List[str]) -> pd.DataFrame:
+    """
+    Ranking TOPSIS semua segmen dari tensor keputusan (G × S × F) dan bobot (G × F).
+    Return: dataframe panjang (Segment, Strategy, Closeness_Score, Rank), urut per segmen lalu rank.
+    """
+    closeness, ranks = topsis_scores_batched(decision_tensor, weights, benefit_mask(criteria_type))
+    G, S = closeness.shape
+    # Urutan: segmen sesuai input, lalu rank per segmen (argsort per baris tensor)
+    order = np.argsort(ranks, axis=1, kind='stable')
+    return pd.DataFrame({
+        'Segment': np.repeat(np.asarray(segments, dtype=object), S),
+        'Strategy': np.asarray(strategies, dtype=object)[order].ravel(),
+        'Closeness_Score': np.take_along_axis(closeness, order, axis=1).ravel(),
+        'Rank': np.take_along_axis(ranks, order, axis=1).ravel().astype(int)
+    })
+
+# ======================================================================
+# TOPSIS OUT-OF-CORE (JUTAAN ALTERNATIF, TOP-K)
+# ======================================================================
+OUT_OF_CORE_CHUNK_SIZE = 262_144
+
+def open_alternatives(source: Union[str, np.ndarray]) -> np.ndarray:
+    """Matriks alternatif (S × F): file .npy dibuka memory-mapped (tidak dimuat ke RAM)"""
+    if isinstance(source, (str, os.PathLike)):
+        X = np.load(source, mmap_mode='r')
+    else:
+        X = source
+    if X.ndim != 2:
+        raise ValueError(f"Matriks alternatif harus 2 dimensi (S × F), bukan {X.shape}")
+    return X
+
+def _chunk_bounds(n_rows: int, chunk_size: int) -> List[Tuple[int, int]]:
+    return [(start, min(start + chunk_size, n_rows)) for start in range(0, n_rows, chunk_size)]
+
+def topsis_column_stats(X: np.ndarray,
+                        benefit: np.ndarray,
+                        chunk_size: int = OUT_OF_CORE_CHUNK_SIZE) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Pass 1 (streaming): norma kolom dan solusi ideal pada matriks ternormalisasi.
+    Karena R = X / norma dengan norma > 0, max/min kolom R = max/min kolom X / norma.
+    Return: (norma F, ideal positif F, ideal negatif F) dalam float64
+    """
+    F = X.shape[1]
+    sumsq = np.zeros(F)
+    col_max = np.full(F, -np.inf)
+    col_min = np.full(F, np.inf)
+    for start, stop in _chunk_bounds(X.shape[0], chunk_size):
+        chunk = np.nan_to_num(np.asarray(X[start:stop], dtype=np.float64), nan=0.0)
+        sumsq += np.einsum('ij,ij->j', chunk, chunk)
+        np.maximum(col_max, chunk.max(axis=0), out=col_max)
+        np.minimum(col_min, chunk.min(axis=0), out=col_min)
+
+    norms = np.sqrt(sumsq)
+    norms[norms == 0] = 1e-9
+    R_max, R_min = col_max / norms, col_min / norms
+    return norms, np.where(benefit, R_max, R_min), np.where(benefit, R_min, R_max)
+
+def _chunk_top_k(X: np.ndarray, start: int, stop: int, k: int, scale: np.ndarray,
+                 R_plus: np.ndarray, R_minus: np.ndarray, W2: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Closeness satu chunk (float32) dan top-k lokalnya via argpartition"""
+    R = np.nan_to_num(np.asarray(X[start:stop], dtype=np.float32), nan=0.0)
+    R *= scale
+    S_plus = np.sqrt(np.square(R - R_plus) @ W2)
+    np.subtract(R, R_minus, out=R)
+    S_minus = np.sqrt(np.square(R, out=R) @ W2)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        closeness = S_minus / (S_plus + S_minus)
+    closeness = np.where(np.isnan(closeness), -np.inf, closeness)
+
+    if len(closeness) > k:
+        local = np.argpartition(closeness, -k)[-k:]
+    else:
+        local = np.arange(len(closeness))
+    return local + start, closeness[local]
+
+@instrument("topsis_top_k", rows=lambda args, result: result.attrs['n_alternatives'])
+def topsis_top_k(alternatives: Union[str, np.ndarray],
+                 weights: Sequence[float],
+                 criteria_type: List[str],
+                 k: int = 10,
+                 chunk_size: int = OUT_OF_CORE_CHUNK_SIZE,
+                 n_threads: Optional[int] = None,
+                 labels: Optional[Sequence] = None) -> pd.DataFrame:
+    """
+    TOPSIS untuk jutaan alternatif tanpa memuat seluruh matriks:
+    - alternatives: path .npy (memory-mapped) atau array/memmap S × F
+    - pass 1 streaming: norma kolom + solusi ideal (float64)
+    - pass 2: closeness per chunk dalam float32, paralel di thread pool (NumPy melepas GIL),
+      tiap chunk hanya menyimpan top-k lokal (argpartition), lalu digabung
+    Memori ~ n_threads × chunk_size × F float32. Hasil setara calculate_topsis untuk k teratas.
+    k < 1 -> ValueError; k di atas jumlah alternatif dibatasi ke jumlah alternatif.
+    Return: dataframe top-k (index = label/posisi alternatif, Closeness_Score, Rank),
+    attrs['n_alternatives'] = jumlah alternatif yang dinilai
+    """
+    if k < 1:
+        raise ValueError(f"k harus minimal 1, bukan {k}")
+    X = open_alternatives(alternatives)
+    benefit = benefit_mask(criteria_type)
+    W = _normalize_weights(weights)[0]
+    if len(W) != X.shape[1] or len(benefit) != X.shape[1]:
+        raise ValueError("Jumlah bobot/kriteria tidak sama dengan jumlah kolom alternatif")
+    k = min(int(k), X.shape[0])
+
+    norms, R_plus, R_minus = topsis_column_stats(X, benefit, chunk_size)
+    scale = (1.0 / norms).astype(np.float32)
+    R_plus, R_minus = R_plus.astype(np.float32), R_minus.astype(np.float32)
+    W2 = (W ** 2).astype(np.float32)
+
+    bounds = _chunk_bounds(X.shape[0], chunk_size)
+    n_threads = n_threads or min(len(bounds), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=max(n_threads, 1)) as executor:
+        parts = list(executor.map(
+            lambda b: _chunk_top_k(X, b[0], b[1], k, scale, R_plus, R_minus, W2), bounds
+        ))
+
+    if parts:
+        index = np.concatenate([p[0] for p in parts])
+        closeness = np.concatenate([p[1] for p in parts])
+    else:
+        index, closeness = np.empty(0, dtype=np.intp), np.empty(0, dtype=np.float32)
+    if len(closeness) > k:
+        keep = np.argpartition(closeness, -k)[-k:]
+        index, closeness = index[keep], closeness[keep]
+    order = np.lexsort((index, -closeness))
+    index, closeness = index[order], closeness[order].astype(np.float64)
+    closeness[np.isinf(closeness)] = np.nan
+
+    names = np.asarray(labels, dtype=object)[index] if labels is not None else index
     results_df = pd.DataFrame({
-        'Strategy': decision_matrix.index,
-        'Closeness_Score': Closeness,
-        'Rank': closeness_series.rank(method='dense', ascending=False).astype(int)
-    }).sort_values(by='Closeness_Score', ascending=False).set_index('Strategy')
-    
-    return results_df
\ No newline at end of file
+        'Alternative': names,
+        'Closeness_Score': closeness,
+        'Rank': _dense_rank_desc(np.nan_to_num(closeness, nan=-1.0)[None, :])[0].astype(int)
+    }).set_index('Alternative')
+    results_df.attrs['n_alternatives'] = int(X.shape[0])
+    return results_df
+
+# ======================================================================
+# ANALISIS SENSITIVITAS BOBOT (MONTE CARLO)
+# ======================================================================
+def sample_weights(weights: List[float],
+                   n_samples: int,
+                   method: str = 'dirichlet',
+                   concentration: float = 200.0,
+                   noise: float = 0.10,
+                   rng: Optional[np.random.Generator] = None) -> np.ndarray:
+    """
+    Sampling N vektor bobot di sekitar bobot dasar.
+    - 'dirichlet': Dirichlet(concentration × w), makin besar concentration makin kecil sebaran
+    - 'uniform'  : w × (1 ± noise), lalu dinormalisasi ulang
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    w = _normalize_weights(weights)[0]
+
+    if method == 'dirichlet':
+        alpha = np.maximum(concentration * w, 1e-6)
+        W = rng.standard_gamma(alpha, size=(n_samples, len(w)))
+    elif method == 'uniform':
+        W = w * (1.0 + rng.uniform(-noise, noise, size=(n_samples, len(w))))
+    else:
+        raise ValueError(f"Metode sampling tidak dikenal: {method}")
+
+    totals = W.sum(axis=1, keepdims=True)
+    totals[totals == 0] = 1.0
+    return W / totals
+
+def _rank_reversal_thresholds(D_plus: np.ndarray,
+                              D_minus: np.ndarray,
+                              w: np.ndarray,
+                              grid_size: int = 200,
+                              max_increase: float = 10.0) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Perubahan relatif minimum bobot tiap kriteria (turun / naik, kriteria lain dinormalisasi
+    ulang) yang membuat strategi peringkat 1 berganti. NaN = tidak ada pembalikan di rentang grid.
+    Semua skenario F × 2 × grid dihitung dalam satu perkalian matriks.
+    """
+    F = len(w)
+    base_top = np.argmax(_closeness(w[None, :], D_plus, D_minus)[0])
+
+    decrease = np.linspace(0.0, 1.0, grid_size + 1)[1:]
+    increase = np.linspace(0.0, max_increase, grid_size + 1)[1:]
+    factors = np.concatenate([1.0 - decrease, 1.0 + increase])
+
+    # W[j, g, :] = w dengan kriteria j dikali factors[g]
+    W = np.broadcast_to(w, (F, len(factors), F)).copy()
+    idx = np.arange(F)
+    W[idx, :, idx] = w[:, None] * factors[None, :]
+    W = W.reshape(-1, F)
+    W = W / np.where(W.sum(axis=1, keepdims=True) == 0, 1.0, W.sum(axis=1, keepdims=True))
+
+    tops = np.argmax(np.nan_to_num(_closeness(W, D_plus, D_minus), nan=-1.0), axis=1)
+    changed = (tops != base_top).reshape(F, 2, grid_size)
+
+    thresholds = []
+    for direction, deltas in enumerate([decrease, increase]):
+        hit = changed[:, direction, :]
+        first = np.argmax(hit, axis=1)
+        thresholds.append(np.where(hit.any(axis=1), deltas[first], np.nan))
+    return thresholds[0], thresholds[1]
+
+@instrument("topsis_sensitivity")
+def topsis_sensitivity(decision_matrix: pd.DataFrame,
+                       weights: List[float],
+                       criteria_type: List[str],
+                       n_samples: int = 10000,
+                       top_k: int = 3,
+                       method: str = 'dirichlet',
+                       concentration: float = 200.0,
+                       noise: float = 0.10,
+                       chunk_size: int = 20000,
+                       seed: Optional[int] = None) -> Dict[str, pd.DataFrame]:
+    """
+    Analisis sensitivitas ranking TOPSIS terhadap perturbasi bobot.
+    Sampel diproses per chunk sehingga memori terbatas pada chunk_size × jumlah strategi.
+    Return dict:
+    - 'summary'          : rank dasar, rata-rata & std rank, P(rank 1), P(top-k) per strategi
+    - 'rank_distribution': probabilitas setiap strategi berada di setiap rank
+    - 'reversal'         : threshold perubahan bobot per kriteria yang membalik strategi teratas
+    """
+    rng = np.random.default_rng(seed)
+    prepared = PreparedTopsis(decision_matrix, criteria_type)
+    D_plus, D_minus = prepared.D_plus, prepared.D_minus
+    w = _normalize_weights(weights)[0]
+    S = prepared.R.shape[0]
+
+    # counts[i, r] = berapa kali strategi i mendapat rank r+1
+    counts = np.zeros(S * S, dtype=np.int64)
+    offsets = np.arange(S) * S
+    done = 0
+    while done < n_samples:
+        n = min(chunk_size, n_samples - done)
+        W = sample_weights(w, n, method=method, concentration=concentration, noise=noise, rng=rng)
+        ranks = _dense_rank_desc(_closeness(W, D_plus, D_minus))
+        counts += np.bincount((offsets + ranks - 1).ravel(), minlength=S * S)
+        done += n
+    counts = counts.reshape(S, S)
+    probs = counts / max(n_samples, 1)
+
+    rank_values = np.arange(1, S + 1)
+    mean_rank = probs @ rank_values
+    std_rank = np.sqrt(np.maximum(probs @ rank_values ** 2 - mean_rank ** 2, 0.0))
+    base_rank = _dense_rank_desc(_closeness(w[None, :], D_plus, D_minus))[0]
+
+    summary = pd.DataFrame({
+        'Base_Rank': base_rank,
+        'Mean_Rank': mean_rank,
+        'Std_Rank': std_rank,
+        'P_Top1': probs[:, 0],
+        f'P_Top{top_k}': probs[:, :top_k].sum(axis=1)
+    }, index=decision_matrix.index).sort_values(['Base_Rank', 'Mean_Rank'])
+    summary.index.name = 'Strategy'
+
+    rank_distribution = pd.DataFrame(probs, index=decision_matrix.index,
+                                     columns=[f'Rank_{r}' for r in rank_values])
+    rank_distribution.index.name = 'Strategy'
+
+    lower, upper = _rank_reversal_thresholds(D_plus, D_minus, w)
+    reversal = pd.DataFrame({
+        'Weight': w,
+        'Decrease_To_Reverse': lower,
+        'Increase_To_Reverse': upper
+    }, index=decision_matrix.columns)
+    reversal.index.name = 'Criterion'
+
+    return {'summary': summary, 'rank_distribution': rank_distribution, 'reversal': reversal}
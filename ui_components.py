@@ -1,6 +1,12 @@
+import hashlib
+import time
+
 import streamlit as st
 import pandas as pd
 
+from data_loader import EXPORT_FORMATS, export_bytes
+from dataset_preview import DEFAULT_PAGE_SIZE, PAGE_SIZE_OPTIONS, DatasetPreview
+
 def set_page_style():
     """Custom CSS tema kuning #ffc20f, hitam, dan putih"""
     st.markdown(
@@ -211,7 +217,7 @@ def show_user_guide():
 
     <strong>Langkah-langkah Penggunaan:</strong>
     <ol>
-        <li>Pengguna mengunggah dataset pelanggan restoran dalam format CSV</li>
+        <li>Pengguna mengunggah dataset pelanggan restoran dalam format CSV, Parquet, atau Arrow/Feather</li>
         <li>Sistem melakukan pemetaan kolom dataset secara otomatis</li>
         <li>Data dianalisis menggunakan model dan metode TOPSIS</li>
         <li>Hasil rekomendasi strategi ditampilkan dalam bentuk peringkat</li>
@@ -260,6 +266,171 @@ def show_summary_stats(df, num_matched, total_features):
         match_pct = (num_matched / total_features * 100)
         create_metric_card("Match Rate", f"{match_pct:.0f}%")
 
+def show_dataset_preview(preview: DatasetPreview, key: str, page_size: int = DEFAULT_PAGE_SIZE):
+    """
+    Preview dataset berhalaman: hanya baris di halaman aktif yang dikirim ke browser.
+    Sort/filter memakai index posisi baris yang di-cache di objek DatasetPreview.
+    """
+    columns = list(preview.df.columns)
+    no_sort, no_filter = "(urutan asli)", "(tanpa filter)"
+    
+    col1, col2, col3, col4 = st.columns([2, 1, 2, 1])
+    with col1:
+        sort_col = st.selectbox("Urutkan berdasarkan", [no_sort] + columns, key=f"{key}_sort")
+    with col2:
+        direction = st.selectbox("Arah", ["Naik", "Turun"], key=f"{key}_dir",
+                                 disabled=sort_col == no_sort)
+    with col3:
+        filter_col = st.selectbox("Filter kolom", [no_filter] + columns, key=f"{key}_filter")
+    with col4:
+        page_size = st.selectbox("Baris/halaman", PAGE_SIZE_OPTIONS,
+                                 index=PAGE_SIZE_OPTIONS.index(page_size) if page_size in PAGE_SIZE_OPTIONS else 0,
+                                 key=f"{key}_size")
+    
+    filters = []
+    if filter_col != no_filter:
+        options = preview.filter_options(filter_col)
+        if options['kind'] == 'between':
+            low, high = options['min'], options['max']
+            if pd.notna(low) and pd.notna(high) and low < high:
+                as_int = pd.api.types.is_integer_dtype(preview.df[filter_col])
+                low, high = (int(low), int(high)) if as_int else (float(low), float(high))
+                selected = st.slider(f"Rentang {filter_col}", low, high, (low, high), key=f"{key}_range_{filter_col}")
+                if selected != (low, high):
+                    filters.append((filter_col, 'between', tuple(selected)))
+        elif options['kind'] == '==':
+            selected = st.selectbox(f"Nilai {filter_col}", options['values'], key=f"{key}_value_{filter_col}")
+            filters.append((filter_col, '==', selected))
+        else:
+            text = st.text_input(f"{filter_col} mengandung", key=f"{key}_text_{filter_col}").strip()
+            if text:
+                filters.append((filter_col, 'contains', text))
+    
+    sort = (sort_col, direction == "Naik") if sort_col != no_sort else None
+    positions = preview.view(sort, filters)
+    n_pages = DatasetPreview.n_pages(len(positions), page_size)
+    
+    # Halaman yang tersimpan bisa melebihi jumlah halaman setelah filter berubah
+    page_key = f"{key}_page"
+    if st.session_state.get(page_key, 1) > n_pages:
+        st.session_state[page_key] = n_pages
+    page = st.number_input("Halaman", min_value=1, max_value=n_pages, step=1, key=page_key)
+    
+    page_df = preview.page(positions, page, page_size)
+    st.dataframe(page_df, use_container_width=True)
+    
+    start = (page - 1) * page_size
+    caption = (f"Baris {start + 1:,}–{start + len(page_df):,} dari {len(positions):,}"
+               if len(positions) else "Tidak ada baris yang cocok dengan filter")
+    if filters:
+        caption += f" (terfilter dari {preview.n_rows:,})"
+    st.caption(f"{caption} · halaman {page:,} / {n_pages:,}")
+
+@st.fragment
+def show_weight_editor(prepared, base_weights: pd.Series, key: str = "weight_editor",
+                       max_sliders: int = 10, top_n: int = 10):
+    """
+    Panel slider bobot kriteria dengan ranking ulang langsung (PreparedTopsis.rank, O(S·F)).
+    Berjalan sebagai fragment: perubahan slider hanya me-rerun panel ini, dan slider baru
+    mengirim nilai saat dilepas (debounce). Ranking dibandingkan dengan bobot importance
+    dan dengan bobot sebelumnya. Slider diisi ulang dari base_weights setiap kali decision
+    matrix atau bobot importance berubah (mis. ganti sumber importance / dataset baru).
+    """
+    features = list(base_weights.sort_values(ascending=False).index[:max_sliders])
+    
+    # Fingerprint decision matrix + bobot importance: berubah -> nilai slider lama tidak berlaku
+    digest = hashlib.sha1(prepared.R.tobytes())
+    digest.update(repr((list(prepared.strategies), list(base_weights.index))).encode("utf-8"))
+    digest.update(base_weights.to_numpy(dtype=float).tobytes())
+    base_changed = st.session_state.get(f"{key}_base") != digest.hexdigest()
+    st.session_state[f"{key}_base"] = digest.hexdigest()
+    
+    reset = st.button("Reset ke bobot importance", key=f"{key}_reset")
+    for f in features:
+        if reset or base_changed or f"{key}_{f}" not in st.session_state:
+            st.session_state[f"{key}_{f}"] = float(base_weights[f])
+    
+    weights = base_weights.astype(float).copy()
+    cols = st.columns(2)
+    for i, f in enumerate(features):
+        with cols[i % 2]:
+            weights[f] = st.slider(f, 0.0, 1.0, step=0.001, format="%.3f", key=f"{key}_{f}")
+    if len(base_weights) > len(features):
+        st.caption(f"{len(base_weights) - len(features)} kriteria lain memakai bobot importance.")
+    
+    if weights.sum() <= 0:
+        st.warning("Minimal satu bobot harus lebih dari 0.")
+        return
+    
+    start = time.perf_counter()
+    order, closeness, ranks = prepared.rank(weights.values)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    base_ranks = prepared.rank(base_weights.values)[2]
+    
+    # Ranking dari bobot sebelumnya (hanya jika decision matrix-nya sama)
+    strategies = tuple(prepared.strategies)
+    previous = st.session_state.get(f"{key}_previous")
+    previous_ranks = previous['ranks'] if previous and previous['strategies'] == strategies else None
+    st.session_state[f"{key}_previous"] = {'strategies': strategies, 'ranks': ranks}
+    
+    top = order[:top_n]
+    table = pd.DataFrame({
+        'Rank': ranks[top],
+        'Strategy': prepared.strategies[top],
+        'Closeness_Score': closeness[top],
+        'Δ vs Importance': base_ranks[top] - ranks[top],
+        'Δ vs Sebelumnya': (previous_ranks[top] - ranks[top]) if previous_ranks is not None else 0,
+    })
+    st.dataframe(
+        table.style.format({'Closeness_Score': '{:.4f}', 'Δ vs Importance': '{:+d}', 'Δ vs Sebelumnya': '{:+d}'}),
+        use_container_width=True,
+        hide_index=True
+    )
+    st.caption(f"Ranking ulang {len(strategies)} strategi × {len(base_weights)} kriteria: {elapsed_ms:.2f} ms. "
+               "Δ positif = naik peringkat.")
+
+def show_download_button(df, basename, fmt="csv", index=True, label=None, **kwargs):
+    """
+    Tombol download dataframe sebagai CSV / Parquet / Feather. Serialisasi ditunda
+    sampai tombol diklik (data callable), bukan di setiap rerun.
+    """
+    mime, ext = EXPORT_FORMATS[fmt]
+    st.download_button(
+        label or f"Download {fmt.upper() if fmt == 'csv' else fmt.capitalize()}",
+        lambda: export_bytes(df, fmt, index=index),
+        f"{basename}{ext}",
+        mime,
+        **kwargs
+    )
+
+def show_performance_panel(records, prometheus_text=None):
+    """Panel Performance: durasi, baris, dan delta memori per stage pada run terakhir"""
+    st.markdown("#### Performance")
+    if not records:
+        st.caption("Belum ada stage yang tercatat pada run ini.")
+        return
+    
+    perf_df = pd.DataFrame([
+        {
+            'Stage': ("· " * r['depth']) + r['stage'],
+            'Durasi (ms)': r['duration_ms'],
+            'Baris': r['rows'],
+            'Δ Memori (MB)': (r['memory_delta_bytes'] / 1e6) if r['memory_delta_bytes'] is not None else None
+        }
+        for r in records
+    ])
+    total_ms = sum(r['duration_ms'] for r in records if r['depth'] == 0)
+    st.caption(f"Total stage tingkat atas: {total_ms:,.0f} ms")
+    st.dataframe(
+        perf_df.style.format({'Durasi (ms)': '{:,.1f}', 'Baris': '{:,.0f}', 'Δ Memori (MB)': '{:+,.1f}'}, na_rep='-'),
+        use_container_width=True,
+        hide_index=True
+    )
+    
+    if prometheus_text:
+        with st.expander("Metrik Prometheus (proses)"):
+            st.code(prometheus_text, language="text")
+
 def show_about():
     st.markdown("""
     <div style="